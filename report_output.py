@@ -0,0 +1,11 @@
+"""
+ルートのテスト・デモスクリプト共通の出力ヘルパー
+"""
+
+import sys
+
+
+def write_lines(lines):
+    """複数行を1回の書き込みでまとめて出力"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
@@ -34,7 +34,8 @@ extras_require = {
     ],
     "dev": [
         "pytest>=8.0.0",
-        "pytest-asyncio>=0.23.0",
+        "pytest-asyncio>=1.4.0",
+        "pytest-xdist>=3.5.0",
         "pytest-mock>=3.12.0",
         "pytest-cov>=4.1.0",
         "black>=24.0.0",
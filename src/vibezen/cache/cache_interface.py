@@ -5,6 +5,7 @@ Cache interface and models for VIBEZEN.
 from abc import ABC, abstractmethod
 from typing import Optional, Any, Dict
 from datetime import datetime
+import time
 from pydantic import BaseModel
 
 
@@ -14,15 +15,15 @@ class CacheEntry(BaseModel):
     key: str
     value: Any
     created_at: datetime
-    expires_at: Optional[datetime] = None
+    expires_at_ns: Optional[int] = None  # time.monotonic_ns() deadline
     hit_count: int = 0
     metadata: Dict[str, Any] = {}
     
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
-        if self.expires_at is None:
+        if self.expires_at_ns is None:
             return False
-        return datetime.now() > self.expires_at
+        return time.monotonic_ns() >= self.expires_at_ns
     
     def increment_hit_count(self):
         """Increment hit count for metrics."""
@@ -2,12 +2,11 @@
 Cache manager for VIBEZEN that handles caching strategies.
 """
 
-import hashlib
-import json
 from typing import Optional, Any, Dict, Callable
 from datetime import datetime
 
 from .cache_interface import CacheInterface, CacheEntry
+from .hashing import canonical_json, hash_key
 from .memory_cache import MemoryCache
 
 
@@ -47,13 +46,26 @@ class CacheManager:
             Cache key string
         """
         # Sort params for consistent hashing
-        sorted_params = json.dumps(params, sort_keys=True, default=str)
+        sorted_params = canonical_json(params)
         
         # Generate hash
         content = f"{operation}:{sorted_params}"
-        hash_digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+        hash_digest = hash_key(content)
         
-        return f"{self.key_prefix}:{operation}:{hash_digest}"
+        return self.digest_key(operation, hash_digest)
+    
+    def digest_key(self, operation: str, digest: str) -> str:
+        """
+        Build a cache key from an already computed digest.
+        
+        Args:
+            operation: Operation name
+            digest: Digest identifying the operation's inputs
+            
+        Returns:
+            Cache key string
+        """
+        return f"{self.key_prefix}:{operation}:{digest}"
     
     async def get_or_compute(
         self,
@@ -61,7 +73,8 @@ class CacheManager:
         params: Dict[str, Any],
         compute_func: Callable,
         ttl_seconds: Optional[int] = None,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        key: Optional[str] = None
     ) -> tuple[Any, bool]:
         """
         Get from cache or compute if not found.
@@ -72,6 +85,7 @@ class CacheManager:
             compute_func: Async function to compute value if not cached
             ttl_seconds: Optional TTL override
             force_refresh: Force computation even if cached
+            key: Precomputed cache key (defaults to generate_key(operation, params))
             
         Returns:
             Tuple of (value, from_cache)
@@ -81,7 +95,8 @@ class CacheManager:
             return value, False
         
         # Generate cache key
-        key = self.generate_key(operation, params)
+        if key is None:
+            key = self.generate_key(operation, params)
         
         # Try to get from cache
         entry = await self.cache.get(key)
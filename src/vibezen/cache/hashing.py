@@ -0,0 +1,69 @@
+"""
+Cache key hashing for VIBEZEN.
+
+Uses BLAKE3 when the ``blake3`` package is installed and falls back
+to the standard library's BLAKE2b otherwise. Key material is
+serialized with ``orjson`` when it is installed, and with the
+standard library's ``json`` otherwise.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def canonical_json(obj: Any, default: Optional[Callable[[Any], Any]] = str) -> str:
+    """
+    Serialize obj to JSON with sorted keys, for use as key material.
+    
+    Uses orjson when it is installed and falls back to the standard
+    json module (also for values orjson cannot encode, such as
+    integers wider than 64 bits). The output is stable within a
+    process but not across serializers, so it must not be persisted
+    or compared with other JSON.
+    
+    Args:
+        obj: Object to serialize
+        default: Fallback for objects JSON cannot represent; None raises
+            TypeError for them instead
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, sort_keys=True, default=default)
+
+
+def hash_key(text: str, digest_size: int = 8) -> str:
+    """
+    Hash text into a hex cache key.
+    
+    Args:
+        text: Text to hash (prompt, serialized parameters, ...)
+        digest_size: Digest length in bytes (the key has twice as many hex digits)
+        
+    Returns:
+        Hex digest string
+    """
+    data = text.encode("utf-8")
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest(length=digest_size)
+    return hashlib.blake2b(data, digest_size=digest_size).hexdigest()
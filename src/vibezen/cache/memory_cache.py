@@ -3,8 +3,9 @@ In-memory LRU cache implementation for VIBEZEN.
 """
 
 from typing import Optional, Any, Dict, OrderedDict
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
+import time
 from collections import OrderedDict as ODict
 
 from .cache_interface import CacheInterface, CacheEntry
@@ -62,31 +63,25 @@ class MemoryCache(CacheInterface):
         async with self._lock:
             # Calculate expiration
             ttl = ttl_seconds or self.default_ttl_seconds
-            expires_at = datetime.now() + timedelta(seconds=ttl) if ttl > 0 else None
+            expires_at_ns = time.monotonic_ns() + ttl * 1_000_000_000 if ttl > 0 else None
             
-            # Create cache entry
-            entry = CacheEntry(
+            # Create cache entry (fields are built here, so skip validation)
+            entry = CacheEntry.model_construct(
                 key=key,
                 value=value,
                 created_at=datetime.now(),
-                expires_at=expires_at,
+                expires_at_ns=expires_at_ns,
                 metadata=metadata or {}
             )
             
-            # Add to cache
-            if key in self._cache:
-                # Update existing entry
-                self._cache[key] = entry
-                self._cache.move_to_end(key)
-            else:
-                # Add new entry
-                self._cache[key] = entry
-                
-                # Evict oldest if at capacity
-                if len(self._cache) > self.max_size:
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
-                    self._total_evictions += 1
+            # Add or replace entry as most recently used
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            
+            # Evict least recently used entry if over capacity
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._total_evictions += 1
     
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
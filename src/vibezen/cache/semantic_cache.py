@@ -13,8 +13,10 @@ from datetime import datetime, timedelta, timezone
 import hashlib
 import json
 import logging
+import time
 
 from .cache_interface import CacheInterface, CacheEntry
+from .hashing import hash_key
 from .memory_cache import MemoryCache
 
 logger = logging.getLogger(__name__)
@@ -30,11 +32,11 @@ class SemanticCacheEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     ttl_seconds: int = 3600
+    created_ns: int = field(default_factory=time.monotonic_ns)
     
     def is_expired(self) -> bool:
         """Check if entry is expired."""
-        age = datetime.now(timezone.utc) - self.created_at
-        return age.total_seconds() > self.ttl_seconds
+        return time.monotonic_ns() - self.created_ns > self.ttl_seconds * 1_000_000_000
 
 
 class EmbeddingProvider:
@@ -59,8 +61,7 @@ class SimpleEmbeddingProvider(EmbeddingProvider):
         # Create multiple hashes for different dimensions
         embeddings = []
         for i in range(self.dimension):
-            hash_obj = hashlib.sha256(f"{normalized}:{i}".encode())
-            hash_bytes = hash_obj.digest()
+            hash_bytes = hashlib.blake2b(f"{normalized}:{i}".encode(), digest_size=4).digest()
             # Convert bytes to float between -1 and 1
             value = (int.from_bytes(hash_bytes[:4], 'big') / (2**32 - 1)) * 2 - 1
             embeddings.append(value)
@@ -166,7 +167,7 @@ class SemanticCache:
             # Find oldest entry
             oldest_key = min(
                 self.entries.keys(),
-                key=lambda k: self.entries[k].created_at
+                key=lambda k: self.entries[k].created_ns
             )
             del self.entries[oldest_key]
             self.stats["evictions"] += 1
@@ -241,7 +242,7 @@ class SemanticCache:
             Cache key
         """
         # Generate key
-        key = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        key = hash_key(prompt)
         
         # Generate embedding
         embedding = await self.embedding_provider.embed(prompt)
@@ -266,10 +267,12 @@ class SemanticCache:
         return key
     
     async def clear(self):
-        """Clear all cache entries."""
+        """Clear all cache entries and reset statistics."""
         self.entries.clear()
         self.embeddings_matrix = None
         self.entry_keys = []
+        for name in self.stats:
+            self.stats[name] = 0
         logger.info("Cleared semantic cache")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -372,7 +375,7 @@ class SemanticCacheManager:
         """
         # Try exact match first if enabled
         if self.exact_enabled:
-            key = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            key = hash_key(prompt)
             entry = await self.exact_cache.get(key)
             if entry is not None:
                 return entry.value, "exact"
@@ -403,7 +406,7 @@ class SemanticCacheManager:
         """
         # Store in exact cache
         if self.exact_enabled:
-            key = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+            key = hash_key(prompt)
             await self.exact_cache.set(
                 key=key,
                 value=response,
@@ -5,17 +5,77 @@ This module ensures that AI operations (challenge, consensus, thinking)
 produce consistent results across runs with the same inputs.
 """
 
+import functools
 import hashlib
 import json
-from typing import Dict, Any, Optional, Union
-from datetime import datetime, date
+from operator import itemgetter
+from typing import Dict, Any, FrozenSet, Optional, Tuple, Union
+from datetime import datetime, date, timedelta
 import random
+import sys
+import threading
+import time
 
 from vibezen.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _digest_context(relevant: Dict[str, Any]) -> str:
+    """Hash context entries as canonical JSON with BLAKE2b."""
+    canonical = json.dumps(relevant, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _digest_scalar_context(items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Hash scalar-only context entries, memoized on their (key, type, value) items."""
+    return _digest_context({key: value for key, _, value in items})
+
+
+# Today's local date in ISO format and the timestamp of the next midnight
+_today_cache: Tuple[str, float] = ("", 0.0)
+
+
+def _today_iso() -> str:
+    """Get today's local date in ISO format, recomputed only after midnight."""
+    global _today_cache
+    
+    iso, next_midnight = _today_cache
+    now = time.time()
+    if now >= next_midnight:
+        today = date.fromtimestamp(now)
+        iso = today.isoformat()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        # Swap in one tuple so concurrent readers never see a half update
+        _today_cache = (iso, midnight.timestamp())
+    return iso
+
+
+_thread_local = threading.local()
+
+
+def _seeded_rng(seed: int) -> random.Random:
+    """Get this thread's shared generator, reseeded with seed."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    # Reseeding reuses the generator's state buffer; same state as Random(seed)
+    rng.seed(seed)
+    return rng
+
+
+@functools.lru_cache(maxsize=1024)
+def _shuffled(seed: int, models: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Shuffle models with a generator seeded by seed (cached per seed and models)."""
+    shuffled = list(models)
+    _seeded_rng(seed).shuffle(shuffled)
+    return tuple(shuffled)
+
+
 class DeterministicSeedManager:
     """Manages deterministic seeds for reproducible AI operations."""
     
@@ -27,14 +87,16 @@ class DeterministicSeedManager:
             base_seed: Base seed for all operations. If None, uses timestamp.
         """
         self.base_seed = base_seed or self._generate_timestamp_seed()
-        self._seed_cache: Dict[str, int] = {}
+        self._seed_key = self._fit_blake2b_param(str(self.base_seed), 64)
+        # Seeds keyed by (operation, context hash, additional factors hash)
+        self._cached_seed = functools.lru_cache(maxsize=4096)(self._compute_seed)
+        self._cached_operations: FrozenSet[str] = frozenset()
         logger.info(f"Initialized DeterministicSeedManager with base_seed: {self.base_seed}")
     
     def _generate_timestamp_seed(self) -> str:
         """Generate a timestamp-based seed for daily consistency."""
         # Use date only (not time) for daily consistency
-        today = date.today()
-        return f"vibezen_{today.isoformat()}"
+        return f"vibezen_{_today_iso()}"
     
     def get_seed(
         self,
@@ -45,6 +107,9 @@ class DeterministicSeedManager:
         """
         Get a deterministic seed for an operation.
         
+        Cheap and non-blocking, so async code can call it directly
+        instead of through asyncio.to_thread().
+        
         Args:
             operation: Operation type (e.g., "challenge", "consensus", "thinkdeep")
             context: Operation context (e.g., code, specification)
@@ -53,64 +118,95 @@ class DeterministicSeedManager:
         Returns:
             Deterministic integer seed
         """
-        # Create a unique key for this operation
-        key_components = {
-            "base_seed": str(self.base_seed),
-            "operation": operation,
-            "context": self._serialize_context(context),
-        }
-        
-        if additional_factors:
-            key_components["additional"] = self._serialize_context(additional_factors)
-        
-        # Generate cache key
-        cache_key = json.dumps(key_components, sort_keys=True)
-        
-        # Check cache
-        if cache_key in self._seed_cache:
-            logger.debug(f"Using cached seed for {operation}")
-            return self._seed_cache[cache_key]
-        
-        # Generate seed using SHA256
-        hash_input = cache_key.encode('utf-8')
-        hash_output = hashlib.sha256(hash_input).hexdigest()
-        
-        # Convert to integer seed (use first 8 bytes)
-        seed = int(hash_output[:16], 16) % (2**32)
+        # Names built at runtime (e.g. zen-MCP tool names) become the same
+        # object as earlier ones, so cache key comparisons hit on identity
+        operation = sys.intern(operation)
+        additional_hash = (
+            self._hash_context(additional_factors) if additional_factors else None
+        )
+        seed = self._cached_seed(operation, self._hash_context(context), additional_hash)
+        if operation not in self._cached_operations:
+            # Rebuilt only for new operations, so stats can hand it out as is
+            self._cached_operations = self._cached_operations | {operation}
+        return seed
+    
+    def _compute_seed(
+        self,
+        operation: str,
+        context_hash: str,
+        additional_hash: Optional[str]
+    ) -> int:
+        """
+        Derive the seed for an operation from its context digests.
         
-        # Cache the seed
-        self._seed_cache[cache_key] = seed
+        Args:
+            operation: Operation type
+            context_hash: Context digest from _hash_context
+            additional_hash: Digest of the additional factors, if any
+            
+        Returns:
+            Deterministic integer seed
+        """
+        # Base seed as the key and operation as the personalization, so
+        # only the context digests need to be hashed
+        message = context_hash if additional_hash is None else f"{context_hash}:{additional_hash}"
+        digest = hashlib.blake2b(
+            message.encode("utf-8"),
+            digest_size=4,
+            key=self._seed_key,
+            person=self._fit_blake2b_param(operation, 16),
+        ).digest()
+        seed = int.from_bytes(digest, "big")
         
         logger.debug(f"Generated seed {seed} for {operation}")
         return seed
     
-    def _serialize_context(self, context: Dict[str, Any]) -> str:
+    @staticmethod
+    def _fit_blake2b_param(value: str, max_size: int) -> bytes:
         """
-        Serialize context to a consistent string representation.
+        Encode value for a size-limited BLAKE2b parameter (key or person).
+        
+        Values that do not fit are hashed down instead of truncated, so
+        long values sharing a prefix stay distinct.
+        """
+        data = value.encode("utf-8")
+        if len(data) > max_size:
+            return hashlib.blake2b(data, digest_size=max_size).digest()
+        return data
+    
+    def _hash_context(self, context: Dict[str, Any]) -> str:
+        """
+        Hash the parts of a context that should affect the seed.
+        
+        The relevant entries are serialized once as canonical JSON and
+        hashed with BLAKE2b.
         
         Args:
             context: Context dictionary
             
         Returns:
-            Serialized string
+            Hex digest of the context
         """
         # Extract key information that should affect the seed
-        serializable = {}
+        relevant = {}
         
         for key, value in context.items():
             if key in ["code", "specification", "prompt", "problem", "proposal"]:
                 # Include content that affects AI behavior
-                if isinstance(value, dict):
-                    serializable[key] = json.dumps(value, sort_keys=True)
-                elif isinstance(value, (str, int, float, bool)):
-                    serializable[key] = str(value)
-                elif isinstance(value, list):
-                    serializable[key] = json.dumps(value, sort_keys=True)
+                if isinstance(value, (dict, list, str, int, float, bool)):
+                    relevant[key] = value
             elif key in ["model", "models", "thinking_mode", "confidence_threshold"]:
                 # Include configuration that affects behavior
-                serializable[key] = str(value)
+                relevant[key] = value
+        
+        if all(type(value) in _SCALAR_TYPES for value in relevant.values()):
+            # Immutable values can key a memo; the type keeps 1, 1.0 and
+            # True apart, which serialize differently
+            return _digest_scalar_context(tuple(sorted(
+                (key, type(value), value) for key, value in relevant.items()
+            )))
         
-        return json.dumps(serializable, sort_keys=True)
+        return _digest_context(relevant)
     
     def get_random_generator(
         self,
@@ -149,16 +245,12 @@ class DeterministicSeedManager:
         # Get seed for this operation
         seed = self.get_seed(operation, params)
         
-        # Add seed to parameters
-        params_with_seed = params.copy()
-        
-        # Add seed and deterministic flags
-        params_with_seed["_vibezen_seed"] = seed
-        params_with_seed["_vibezen_deterministic"] = True
+        # Shallow copy with seed and deterministic flags; nested values are
+        # shared with params and never mutated
+        params_with_seed = {**params, "_vibezen_seed": seed, "_vibezen_deterministic": True}
         
         # For models that support temperature, set to 0 for determinism
-        if "temperature" not in params_with_seed:
-            params_with_seed["temperature"] = 0.0
+        params_with_seed.setdefault("temperature", 0.0)
         
         # Add seed to model selection if using consensus
         if operation == "consensus" and "models" in params_with_seed:
@@ -166,10 +258,14 @@ class DeterministicSeedManager:
             models = params_with_seed["models"]
             if isinstance(models, list):
                 # Sort models by name for consistency
-                sorted_models = sorted(
-                    models,
-                    key=lambda m: m.get("model", "") if isinstance(m, dict) else str(m)
-                )
+                try:
+                    sorted_models = sorted(models, key=itemgetter("model"))
+                except (KeyError, TypeError):
+                    # Plain model names or entries without a "model" key
+                    sorted_models = sorted(
+                        models,
+                        key=lambda m: m.get("model", "") if isinstance(m, dict) else str(m)
+                    )
                 params_with_seed["models"] = sorted_models
         
         logger.debug(f"Applied seed {seed} to {operation} parameters")
@@ -190,34 +286,37 @@ class DeterministicSeedManager:
         Returns:
             Deterministically ordered model list
         """
-        # Get random generator for this context
-        rng = self.get_random_generator("model_selection", context)
-        
-        # Create a copy and shuffle deterministically
-        models = available_models.copy()
-        rng.shuffle(models)
+        seed = self.get_seed("model_selection", context)
         
-        return models
+        try:
+            return list(_shuffled(seed, tuple(available_models)))
+        except TypeError:
+            # Unhashable model entries (e.g. dicts) cannot be cached
+            models = available_models.copy()
+            _seeded_rng(seed).shuffle(models)
+            return models
     
     def reset_cache(self):
         """Reset the seed cache."""
-        self._seed_cache.clear()
+        self._cached_seed.cache_clear()
+        self._cached_operations = frozenset()
         logger.info("Seed cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about seed cache usage."""
+        cache_info = self._cached_seed.cache_info()
         return {
             "base_seed": str(self.base_seed),
-            "cache_size": len(self._seed_cache),
-            "cached_operations": list(set(
-                json.loads(k)["operation"] 
-                for k in self._seed_cache.keys()
-            ))
+            "cache_size": cache_info.currsize,
+            "cache_hits": cache_info.hits,
+            "cache_misses": cache_info.misses,
+            "cached_operations": self._cached_operations,
         }
 
 
 # Global instance for convenience
 _global_seed_manager: Optional[DeterministicSeedManager] = None
+_global_seed_manager_lock = threading.Lock()
 
 
 def get_seed_manager(base_seed: Optional[Union[str, int]] = None) -> DeterministicSeedManager:
@@ -232,8 +331,12 @@ def get_seed_manager(base_seed: Optional[Union[str, int]] = None) -> Determinist
     """
     global _global_seed_manager
     
+    # Lock only while creating, so concurrent first calls agree on one
+    # instance (and base seed) and later calls stay lock-free
     if _global_seed_manager is None:
-        _global_seed_manager = DeterministicSeedManager(base_seed)
+        with _global_seed_manager_lock:
+            if _global_seed_manager is None:
+                _global_seed_manager = DeterministicSeedManager(base_seed)
     
     return _global_seed_manager
 
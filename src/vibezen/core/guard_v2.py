@@ -24,6 +24,7 @@ from vibezen.providers.registry import ProviderRegistry
 from vibezen.prompts.template_engine import PromptTemplateEngine
 from vibezen.prompts.phases import PhaseManager
 from vibezen.metrics import MetricsCollector, SystemMetric, MetricType
+from vibezen.utils.pattern_set import compile_patterns
 
 
 logger = logging.getLogger(__name__)
@@ -89,6 +90,25 @@ class VIBEZENGuardV2:
         self._initialized = True
         logger.info("VIBEZEN Guard V2 initialized")
     
+    async def close(self) -> None:
+        """Close provider connections."""
+        await self.provider_registry.close()
+        self._initialized = False
+    
+    async def reset_state(self) -> None:
+        """
+        Reset per-workflow state while keeping initialized providers.
+        
+        Clears the current thinking context, phase progress, cached
+        responses and provider circuit breakers, so the guard can be
+        reused for an unrelated workflow without re-initializing.
+        """
+        self.current_context = None
+        self.phase_manager = PhaseManager()
+        await self.ai_proxy.clear_cache()
+        for provider in list(self.ai_proxy.circuit_breakers):
+            await self.ai_proxy.reset_circuit_breaker(provider)
+    
     async def guide_specification_understanding(
         self,
         specification: Dict[str, Any],
@@ -440,15 +460,14 @@ class VIBEZENGuardV2:
         
         # Check for hardcodes
         if self.config.triggers.hardcode_detection.enabled:
-            import re
-            for pattern in self.config.triggers.hardcode_detection.patterns:
-                if re.search(pattern, code):
-                    violations.append(SpecViolation(
-                        type=ViolationType.HARDCODE,
-                        description=f"Hardcoded value matching: {pattern}",
-                        severity=Severity.HIGH,
-                        suggested_action="Move to configuration",
-                    ))
+            pattern_set = compile_patterns(tuple(self.config.triggers.hardcode_detection.patterns))
+            for pattern in pattern_set.matching(code):
+                violations.append(SpecViolation(
+                    type=ViolationType.HARDCODE,
+                    description=f"Hardcoded value matching: {pattern}",
+                    severity=Severity.HIGH,
+                    suggested_action="Move to configuration",
+                ))
         
         return violations
     
@@ -205,7 +205,7 @@ class ThinkingResult(BaseModel):
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingContext:
     """Context for thinking process."""
     phase: ThinkingPhase
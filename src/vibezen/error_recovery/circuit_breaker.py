@@ -4,6 +4,7 @@ Circuit breaker pattern implementation for fault tolerance.
 
 import asyncio
 import logging
+import time
 from typing import TypeVar, Callable, Optional, Any, Tuple, Type
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -43,13 +44,28 @@ class CircuitBreakerConfig:
 class CircuitBreaker:
     """Circuit breaker for fault tolerance."""
     
-    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            name: Name of the protected operation
+            config: Circuit breaker configuration
+            clock: Monotonic time source in seconds for the open timeout
+        """
         self.name = name
         self.config = config or CircuitBreakerConfig()
+        self.clock = clock
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: Optional[datetime] = None
+        self._last_failure_at: Optional[float] = None
         self.half_open_calls = 0
         self._lock = asyncio.Lock()
         
@@ -109,9 +125,9 @@ class CircuitBreaker:
         """Check and update circuit state."""
         if self.state == CircuitState.OPEN:
             # Check if timeout has passed
-            if self.last_failure_time:
-                time_since_failure = datetime.now() - self.last_failure_time
-                if time_since_failure >= self.config.timeout:
+            if self._last_failure_at is not None:
+                time_since_failure = self.clock() - self._last_failure_at
+                if time_since_failure >= self.config.timeout.total_seconds():
                     logger.info(
                         f"Circuit breaker '{self.name}' moving to HALF_OPEN"
                     )
@@ -142,6 +158,7 @@ class CircuitBreaker:
         async with self._lock:
             self.failure_count += 1
             self.last_failure_time = datetime.now()
+            self._last_failure_at = self.clock()
             
             logger.warning(
                 f"Circuit breaker '{self.name}' failure {self.failure_count}: {exception}"
@@ -191,6 +208,7 @@ class CircuitBreaker:
             self.failure_count = 0
             self.success_count = 0
             self.last_failure_time = None
+            self._last_failure_at = None
             self.half_open_calls = 0
             logger.info(f"Circuit breaker '{self.name}' manually reset")
 
@@ -74,9 +74,17 @@ class VIBEZENWorkflowIntegration:
     - Phase 5: Documentation - Report generation
     """
     
-    def __init__(self, config: Optional[VIBEZENConfig] = None):
-        """Initialize VIBEZEN integration."""
+    def __init__(self, config: Optional[VIBEZENConfig] = None, provider_manager=None):
+        """
+        Initialize VIBEZEN integration.
+        
+        Args:
+            config: VIBEZEN configuration
+            provider_manager: Optional provider manager to share with other
+                thinking engines instead of creating a new one
+        """
         self.config = config or VIBEZENConfig()
+        self.provider_manager = provider_manager
         self.ai_proxy = None
         self.thinking_engine = None
         self.circuit_breaker_integration = None
@@ -136,7 +144,10 @@ class VIBEZENWorkflowIntegration:
                 'primary_provider': self.config.primary_provider,
                 'thinking_model': 'gpt-4'  # Use best model for thinking
             }
-            self.thinking_engine = SequentialThinkingEngine(thinking_config)
+            self.thinking_engine = SequentialThinkingEngine(
+                thinking_config,
+                provider_manager=self.provider_manager
+            )
         
         # Initialize Circuit Breaker Integration
         if self.config.enable_circuit_breaker:
@@ -14,6 +14,7 @@ from .structured_logger import (
 )
 from .formatters import JSONFormatter, PrettyFormatter
 from .handlers import AsyncFileHandler, MetricsHandler
+from .config import LoggingConfig, setup_logging, set_format, get_metrics
 
 __all__ = [
     'StructuredLogger',
@@ -24,5 +25,9 @@ __all__ = [
     'JSONFormatter',
     'PrettyFormatter',
     'AsyncFileHandler',
-    'MetricsHandler'
+    'MetricsHandler',
+    'LoggingConfig',
+    'setup_logging',
+    'set_format',
+    'get_metrics'
 ]
\ No newline at end of file
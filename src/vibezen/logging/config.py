@@ -127,6 +127,19 @@ class LoggingConfig:
         )
 
 
+# Formatter classes by format name
+_FORMATTERS = {
+    'json': JSONFormatter,
+    'pretty': PrettyFormatter,
+    'compact': CompactFormatter
+}
+
+
+def _make_formatter(format: str) -> logging.Formatter:
+    """Create the formatter for a format name (pretty if unknown)."""
+    return _FORMATTERS.get(format, PrettyFormatter)()
+
+
 def setup_logging(config: Optional[LoggingConfig] = None):
     """
     Setup VIBEZEN logging system.
@@ -137,13 +150,7 @@ def setup_logging(config: Optional[LoggingConfig] = None):
     if config is None:
         config = LoggingConfig.from_env()
     
-    # Create formatters
-    formatters = {
-        'json': JSONFormatter(),
-        'pretty': PrettyFormatter(),
-        'compact': CompactFormatter()
-    }
-    formatter = formatters.get(config.format, PrettyFormatter())
+    formatter = _make_formatter(config.format)
     
     # Root logger configuration
     root_logger = logging.getLogger()
@@ -251,6 +258,23 @@ def setup_logging(config: Optional[LoggingConfig] = None):
     )
 
 
+def set_format(format: str):
+    """
+    Switch the output format of the installed VIBEZEN handlers.
+    
+    Only the formatters are replaced; handlers, open files and
+    background writers set up by setup_logging stay in place.
+    Remote logging always stays JSON.
+    
+    Args:
+        format: Output format ('json', 'pretty' or 'compact')
+    """
+    formatter = _make_formatter(format)
+    for handler in logging.getLogger('vibezen').handlers:
+        if not isinstance(handler, (MetricsHandler, RemoteHandler)):
+            handler.setFormatter(formatter)
+
+
 # Global metrics handler registry
 _metrics_handlers: Dict[str, MetricsHandler] = {}
 
@@ -5,7 +5,59 @@ Log formatters for VIBEZEN structured logging.
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# LogRecord attributes that are not copied into the JSON output
+_RESERVED_ATTRS = frozenset({
+    'name', 'msg', 'args', 'created', 'filename',
+    'funcName', 'levelname', 'levelno', 'lineno',
+    'module', 'msecs', 'message', 'pathname', 'process',
+    'processName', 'relativeCreated', 'thread', 'threadName',
+    'exc_info', 'exc_text', 'stack_info', 'log_entry'
+})
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize log data to a single-line JSON string.
+    
+    Uses orjson when it is installed and falls back to the standard
+    json module (also for values orjson cannot encode, such as
+    integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, default=str)
+
+
+def get_log_data(record: logging.LogRecord) -> Optional[Dict[str, Any]]:
+    """
+    Get the structured log entry of a record.
+    
+    StructuredLogger attaches the entry dict to the record as
+    ``log_entry``, so its JSON message does not have to be parsed
+    again. Messages from other loggers are parsed as JSON.
+    
+    Returns:
+        A copy of the entry, or None if the message is not structured
+    """
+    entry = getattr(record, 'log_entry', None)
+    if entry is not None:
+        return dict(entry)
+    try:
+        log_data = json.loads(record.getMessage())
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return log_data if isinstance(log_data, dict) else None
 
 
 class JSONFormatter(logging.Formatter):
@@ -18,10 +70,8 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
-        # Try to parse the message as JSON first
-        try:
-            log_data = json.loads(record.getMessage())
-        except (json.JSONDecodeError, ValueError):
+        log_data = get_log_data(record)
+        if log_data is None:
             # Fallback to standard format
             log_data = {
                 'timestamp': datetime.utcnow().isoformat(),
@@ -36,14 +86,10 @@ class JSONFormatter(logging.Formatter):
         
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'created', 'filename', 
-                          'funcName', 'levelname', 'levelno', 'lineno', 
-                          'module', 'msecs', 'message', 'pathname', 'process',
-                          'processName', 'relativeCreated', 'thread', 'threadName',
-                          'exc_info', 'exc_text', 'stack_info']:
+            if key not in _RESERVED_ATTRS:
                 log_data[key] = value
         
-        return json.dumps(log_data, default=str)
+        return dumps(log_data)
 
 
 class PrettyFormatter(logging.Formatter):
@@ -69,12 +115,10 @@ class PrettyFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record for human readability."""
-        # Try to parse JSON message
-        try:
-            log_data = json.loads(record.getMessage())
-            return self._format_structured(record, log_data)
-        except (json.JSONDecodeError, ValueError):
+        log_data = get_log_data(record)
+        if log_data is None:
             return self._format_standard(record)
+        return self._format_structured(record, log_data)
     
     def _format_structured(self, record: logging.LogRecord, log_data: Dict[str, Any]) -> str:
         """Format structured log data."""
@@ -158,7 +202,7 @@ class PrettyFormatter(logging.Formatter):
         
         extra_fields = {k: v for k, v in log_data.items() if k not in skip_fields}
         if extra_fields:
-            lines.append(f"  Extra: {json.dumps(extra_fields, default=str)}")
+            lines.append(f"  Extra: {dumps(extra_fields)}")
         
         return '\n'.join(lines)
     
@@ -186,10 +230,8 @@ class CompactFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record in compact format."""
-        # Try to parse JSON message
-        try:
-            log_data = json.loads(record.getMessage())
-            
+        log_data = get_log_data(record)
+        if log_data is not None:
             # Build compact format
             parts = [
                 log_data.get('timestamp', datetime.utcnow().isoformat())[:19],
@@ -207,7 +249,6 @@ class CompactFormatter(logging.Formatter):
                 parts.append(f"{log_data['duration_ms']}ms")
             
             return " | ".join(parts)
-            
-        except (json.JSONDecodeError, ValueError):
-            # Fallback
-            return f"{datetime.utcnow().isoformat()[:19]} | {record.levelname[:4]} | {record.name.split('.')[-1][:15]} | {record.getMessage()[:100]}"
\ No newline at end of file
+        
+        # Fallback
+        return f"{datetime.utcnow().isoformat()[:19]} | {record.levelname[:4]} | {record.name.split('.')[-1][:15]} | {record.getMessage()[:100]}"
\ No newline at end of file
@@ -4,16 +4,17 @@ Custom log handlers for VIBEZEN.
 
 import asyncio
 import logging
-import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 import aiofiles
-from threading import Thread, Event
+from threading import Thread, Event, Condition
 from queue import Queue, Empty
 
+from .formatters import get_log_data
+
 
 class AsyncFileHandler(logging.Handler):
     """
@@ -48,6 +49,11 @@ class AsyncFileHandler(logging.Handler):
         self.buffer: deque = deque(maxlen=buffer_size)
         self.flush_event = Event()
         
+        # Flush tracking: requested vs. completed flush generations
+        self._flush_condition = Condition()
+        self._flush_requested = 0
+        self._flush_completed = 0
+        
         # Start background writer thread
         self.writer_thread = Thread(target=self._run_writer, daemon=True)
         self.writer_thread.start()
@@ -86,9 +92,18 @@ class AsyncFileHandler(logging.Handler):
             ):
                 self.flush_event.clear()
             
+            # Entries queued before this generation was requested are
+            # drained by the write below
+            with self._flush_condition:
+                generation = self._flush_requested
+            
             # Write buffered entries
             if self.buffer:
                 await self._write_buffer()
+            
+            with self._flush_condition:
+                self._flush_completed = generation
+                self._flush_condition.notify_all()
     
     async def _write_buffer(self):
         """Write buffer to file."""
@@ -107,10 +122,9 @@ class AsyncFileHandler(logging.Handler):
         if self.filename.exists() and self.filename.stat().st_size > self.max_bytes:
             await self._rotate()
         
-        # Write entries
+        # Write all entries with a single call
         async with aiofiles.open(self.filename, 'a') as f:
-            for entry in entries:
-                await f.write(entry + '\n')
+            await f.write('\n'.join(entries) + '\n')
     
     async def _rotate(self):
         """Rotate log files."""
@@ -125,6 +139,32 @@ class AsyncFileHandler(logging.Handler):
         if self.filename.exists():
             self.filename.rename(f"{self.filename}.1")
     
+    def wait_for_flush(self, timeout: float = 5.0) -> bool:
+        """
+        Block until entries buffered so far are written to disk.
+        
+        Returns:
+            True if the writer caught up before the timeout
+        """
+        if not self.writer_thread.is_alive():
+            return False
+        
+        with self._flush_condition:
+            self._flush_requested += 1
+            target = self._flush_requested
+        
+        self.flush_event.set()
+        
+        with self._flush_condition:
+            return self._flush_condition.wait_for(
+                lambda: self._flush_completed >= target,
+                timeout
+            )
+    
+    async def drain(self, timeout: float = 5.0) -> bool:
+        """Async variant of wait_for_flush() that does not block the event loop."""
+        return await asyncio.to_thread(self.wait_for_flush, timeout)
+    
     def close(self):
         """Close the handler."""
         self.flush_event.set()
@@ -163,10 +203,8 @@ class MetricsHandler(logging.Handler):
     def emit(self, record: logging.LogRecord):
         """Process log record for metrics."""
         try:
-            # Parse JSON message
-            try:
-                log_data = json.loads(record.getMessage())
-            except (json.JSONDecodeError, ValueError):
+            log_data = get_log_data(record)
+            if log_data is None:
                 return
             
             # Extract metrics
@@ -180,6 +218,15 @@ class MetricsHandler(logging.Handler):
                     timestamp
                 )
             
+            # Batched metrics
+            for metric in log_data.get('metrics') or ():
+                if 'metric_name' in metric and 'metric_value' in metric:
+                    self._record_metric(
+                        metric['metric_name'],
+                        metric['metric_value'],
+                        timestamp
+                    )
+            
             # Duration metrics
             if 'duration_ms' in log_data and 'operation' in log_data:
                 self._record_metric(
@@ -361,9 +408,8 @@ class RemoteHandler(logging.Handler):
         """Emit log record."""
         try:
             # Parse log data
-            try:
-                log_data = json.loads(record.getMessage())
-            except (json.JSONDecodeError, ValueError):
+            log_data = get_log_data(record)
+            if log_data is None:
                 log_data = {
                     'timestamp': datetime.utcnow().isoformat(),
                     'level': record.levelname,
@@ -8,7 +8,6 @@ performance metrics, and integration with monitoring systems.
 import logging
 import time
 import asyncio
-import json
 import traceback
 from typing import Dict, Any, Optional, List, Union, Callable
 from dataclasses import dataclass, field, asdict
@@ -17,6 +16,9 @@ from datetime import datetime
 from contextvars import ContextVar
 from functools import wraps
 import inspect
+from array import array
+
+from .formatters import dumps
 
 # Context variable for request tracking
 request_context: ContextVar[Dict[str, Any]] = ContextVar('request_context', default={})
@@ -34,6 +36,19 @@ class LogLevel(Enum):
     SECURITY = "security"  # For security events
 
 
+# Standard logging level used to emit each VIBEZEN level
+_LEVEL_NUMBERS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+    LogLevel.METRIC: logging.INFO,
+    LogLevel.AUDIT: logging.INFO,
+    LogLevel.SECURITY: logging.WARNING
+}
+
+
 @dataclass
 class LogContext:
     """Context information for structured logging."""
@@ -80,7 +95,8 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self._set_level(level)
         self._handlers: List[logging.Handler] = []
-        self._metrics: Dict[str, List[float]] = {}
+        # Per-metric contiguous float64 storage (one typed array per metric name)
+        self._metrics: Dict[str, array] = {}
         
     def _set_level(self, level: Union[str, LogLevel]):
         """Set logging level."""
@@ -170,22 +186,15 @@ class StructuredLogger:
         entry = self._format_message(level, message, context, error, duration, **kwargs)
         
         # Convert to JSON for structured output
-        json_message = json.dumps(entry, default=str)
+        json_message = dumps(entry)
         
-        # Use appropriate logging level
-        level_map = {
-            LogLevel.DEBUG: self.logger.debug,
-            LogLevel.INFO: self.logger.info,
-            LogLevel.WARNING: self.logger.warning,
-            LogLevel.ERROR: self.logger.error,
-            LogLevel.CRITICAL: self.logger.critical,
-            LogLevel.METRIC: self.logger.info,
-            LogLevel.AUDIT: self.logger.info,
-            LogLevel.SECURITY: self.logger.warning
-        }
-        
-        log_func = level_map.get(level, self.logger.info)
-        log_func(json_message)
+        # Use appropriate logging level; the entry rides along on the record
+        # so formatters and handlers do not have to parse the JSON again
+        self.logger.log(
+            _LEVEL_NUMBERS.get(level, logging.INFO),
+            json_message,
+            extra={'log_entry': entry}
+        )
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
@@ -219,9 +228,40 @@ class StructuredLogger:
         )
         
         # Track metric for aggregation
-        if metric_name not in self._metrics:
-            self._metrics[metric_name] = []
-        self._metrics[metric_name].append(value)
+        self._track_metric(metric_name, value)
+    
+    def _track_metric(self, metric_name: str, value: float):
+        """Append a metric sample to its per-name series."""
+        series = self._metrics.get(metric_name)
+        if series is None:
+            series = self._metrics[metric_name] = array('d')
+        series.append(value)
+    
+    def metrics_batch(self, records: List[Dict[str, Any]], **kwargs):
+        """
+        Log multiple metrics as a single structured entry.
+        
+        Each record needs 'name' and 'value'; 'unit' is optional.
+        Formatting and handler dispatch happen once for the whole batch.
+        """
+        metrics = [
+            {
+                'metric_name': record['name'],
+                'metric_value': record['value'],
+                'metric_unit': record.get('unit', '')
+            }
+            for record in records
+        ]
+        self._log(
+            LogLevel.METRIC,
+            f"Metrics batch: {len(metrics)} entries",
+            metrics=metrics,
+            **kwargs
+        )
+        
+        # Track metrics for aggregation
+        for record in records:
+            self._track_metric(record['name'], record['value'])
     
     def audit(self, action: str, resource: str, result: str, **kwargs):
         """Log audit event."""
@@ -336,10 +376,12 @@ class StructuredLogger:
         summary = {}
         for metric_name, values in self._metrics.items():
             if values:
+                count = len(values)
+                total = sum(values)
                 summary[metric_name] = {
-                    'count': len(values),
-                    'sum': sum(values),
-                    'mean': sum(values) / len(values),
+                    'count': count,
+                    'sum': total,
+                    'mean': total / count,
                     'min': min(values),
                     'max': max(values)
                 }
@@ -21,13 +21,20 @@ logger = logging.getLogger(__name__)
 class MetricsCollector:
     """Collects and manages metrics from various parts of the system"""
     
-    def __init__(self, storage: MetricsStorage):
+    def __init__(
+        self,
+        storage: MetricsStorage,
+        buffer_size: int = 100,
+        flush_interval: float = 5.0
+    ):
         self.storage = storage
         self._buffer: List[BaseMetric] = []
-        self._buffer_size = 100
-        self._flush_interval = 5.0  # seconds
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval  # seconds
         self._running = False
         self._flush_task: Optional[asyncio.Task] = None
+        # Background flush started when the buffer fills up
+        self._pending_flush: Optional[asyncio.Task] = None
         
     async def start(self):
         """Start the metrics collector"""
@@ -50,9 +57,20 @@ class MetricsCollector:
                 pass
                 
         # Flush remaining metrics
-        await self._flush_buffer()
+        await self.flush()
         logger.info("Metrics collector stopped")
         
+    async def flush(self):
+        """Write all buffered metrics to storage"""
+        if self._pending_flush:
+            await self._pending_flush
+            self._pending_flush = None
+        await self._flush_buffer()
+        
+    def count(self) -> int:
+        """Return the number of metrics buffered but not yet flushed"""
+        return len(self._buffer)
+        
     async def collect_learning_metric(
         self,
         metric_type: MetricType,
@@ -166,25 +184,27 @@ class MetricsCollector:
         """Add metric to buffer"""
         self._buffer.append(metric)
         
-        # Flush if buffer is full
-        if len(self._buffer) >= self._buffer_size:
-            await self._flush_buffer()
+        # Flush in the background if buffer is full, so collecting a
+        # metric never waits on storage I/O
+        if len(self._buffer) >= self._buffer_size and \
+                (self._pending_flush is None or self._pending_flush.done()):
+            self._pending_flush = asyncio.create_task(self._flush_buffer())
             
     async def _flush_buffer(self):
         """Flush metrics buffer to storage"""
         if not self._buffer:
             return
-            
-        metrics_to_store = self._buffer.copy()
-        self._buffer.clear()
+        
+        # Swap in a fresh buffer; metrics collected during the write go there
+        metrics_to_store, self._buffer = self._buffer, []
         
         try:
             await self.storage.store_metrics(metrics_to_store)
             logger.debug(f"Flushed {len(metrics_to_store)} metrics to storage")
         except Exception as e:
             logger.error(f"Failed to flush metrics: {e}")
-            # Re-add metrics to buffer on failure
-            self._buffer.extend(metrics_to_store)
+            # Re-add metrics to buffer on failure, ahead of newer ones
+            self._buffer[:0] = metrics_to_store
             
     async def _periodic_flush(self):
         """Periodically flush metrics buffer"""
@@ -9,11 +9,17 @@
 
 import ast
 import re
-from typing import Dict, List, Any, Optional, Tuple, Set
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 import json
 from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    # orjsonが無い環境では標準のjsonにフォールバック
+    orjson = None
 
 from vibezen.core.types import IntrospectionTrigger
 from vibezen.monitoring.metrics import get_metrics_collector
@@ -78,7 +84,7 @@ class PatternFactory:
                 {
                     "type": "magic_number",
                     "regex": r'\b(?<!\.)\d{3,}\b(?!\.)',  
-                    "exceptions": ["0", "1", "-1", "100", "1000"]
+                    "exceptions": frozenset(["0", "1", "-1", "100", "1000"])
                 },
                 {
                     "type": "hardcoded_path",
@@ -163,44 +169,75 @@ class DetectionEngine:
     """検出処理を責任分離"""
     
     @staticmethod
-    def detect_magic_numbers(code: str, rule: Dict[str, Any]) -> List[IntrospectionTrigger]:
-        """マジックナンバーを検出"""
-        triggers = []
-        exceptions = set(rule.get("exceptions", []))
-        pattern = re.compile(rule["regex"])
+    @lru_cache(maxsize=8)
+    def _split_lines(code: str) -> Tuple[str, ...]:
+        """コードを行に分割（同一コードに対する複数ルールで共有）"""
+        return tuple(code.split('\n'))
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _parse(code: str) -> ast.AST:
+        """コードをASTに変換（同一コードに対する複数ルールで共有）"""
+        return ast.parse(code)
+    
+    @staticmethod
+    def build_magic_number_detector(rule: Dict[str, Any]) -> Callable[[str], List[IntrospectionTrigger]]:
+        """ルールの正規表現・例外セットを束縛したマジックナンバー検出関数を生成"""
+        # frozensetはそのまま再利用される（PatternFactory生成ルールではコピー不要）
+        exceptions = frozenset(rule.get("exceptions", ()))
+        findall = re.compile(rule["regex"]).findall
+        split_lines = DetectionEngine._split_lines
+        
+        def detect(code: str) -> List[IntrospectionTrigger]:
+            triggers = []
+            
+            for line_num, line in enumerate(split_lines(code), 1):
+                for match in findall(line):
+                    if match not in exceptions:
+                        triggers.append(IntrospectionTrigger(
+                            trigger_type="hardcode_number",
+                            message=f"マジックナンバー '{match}' が使用されています",
+                            severity="medium",
+                            code_location=f"line {line_num}",
+                            suggestion="定数として定義してください"
+                        ))
+            
+            return triggers
+        
+        return detect
+    
+    @staticmethod
+    def build_hardcoded_path_detector(rule: Dict[str, Any]) -> Callable[[str], List[IntrospectionTrigger]]:
+        """ルールの正規表現を束縛したハードコードパス検出関数を生成"""
+        findall = re.compile(rule["regex"]).findall
+        split_lines = DetectionEngine._split_lines
         
-        for line_num, line in enumerate(code.split('\n'), 1):
-            matches = pattern.findall(line)
-            for match in matches:
-                if match not in exceptions:
+        def detect(code: str) -> List[IntrospectionTrigger]:
+            triggers = []
+            
+            for line_num, line in enumerate(split_lines(code), 1):
+                for match in findall(line):
                     triggers.append(IntrospectionTrigger(
-                        trigger_type="hardcode_number",
-                        message=f"マジックナンバー '{match}' が使用されています",
-                        severity="medium",
+                        trigger_type="hardcode_path",
+                        message=f"ハードコードされたパス {match} が検出されました",
+                        severity="high",
                         code_location=f"line {line_num}",
-                        suggestion="定数として定義してください"
+                        suggestion="設定ファイルまたは環境変数を使用してください"
                     ))
+            
+            return triggers
         
-        return triggers
+        return detect
+    
+    @staticmethod
+    def detect_magic_numbers(code: str, rule: Dict[str, Any]) -> List[IntrospectionTrigger]:
+        """マジックナンバーを検出"""
+        return DetectionEngine.build_magic_number_detector(rule)(code)
     
     @staticmethod
     def detect_hardcoded_paths(code: str, rule: Dict[str, Any]) -> List[IntrospectionTrigger]:
         """ハードコードされたパスを検出"""
-        triggers = []
-        pattern = re.compile(rule["regex"])
-        
-        for line_num, line in enumerate(code.split('\n'), 1):
-            matches = pattern.findall(line)
-            for match in matches:
-                triggers.append(IntrospectionTrigger(
-                    trigger_type="hardcode_path",
-                    message=f"ハードコードされたパス {match} が検出されました",
-                    severity="high",
-                    code_location=f"line {line_num}",
-                    suggestion="設定ファイルまたは環境変数を使用してください"
-                ))
-        
-        return triggers
+        return DetectionEngine.build_hardcoded_path_detector(rule)(code)
     
     @staticmethod
     def detect_long_methods_safe(code: str, rule: Dict[str, Any]) -> List[IntrospectionTrigger]:
@@ -208,7 +245,7 @@ class DetectionEngine:
         triggers = []
         
         try:
-            tree = ast.parse(code)
+            tree = DetectionEngine._parse(code)
             
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
@@ -238,7 +275,7 @@ class DetectionEngine:
         triggers = []
         
         try:
-            tree = ast.parse(code)
+            tree = DetectionEngine._parse(code)
             
             for node in ast.walk(tree):
                 if isinstance(node, ast.ExceptHandler):
@@ -256,6 +293,20 @@ class DetectionEngine:
             logger.error(f"AST解析で予期しないエラー: {e}")
         
         return triggers
+    
+    @staticmethod
+    def specialize(rule: Dict[str, Any]) -> Optional[Callable[[str], List[IntrospectionTrigger]]]:
+        """ルールに特化した検出関数を生成（未対応のルールタイプはNone）"""
+        rule_type = rule.get("type")
+        if rule_type == "magic_number":
+            return DetectionEngine.build_magic_number_detector(rule)
+        if rule_type == "hardcoded_path":
+            return DetectionEngine.build_hardcoded_path_detector(rule)
+        if rule_type == "long_method":
+            return partial(DetectionEngine.detect_long_methods_safe, rule=rule)
+        if rule_type == "bare_except":
+            return partial(DetectionEngine.detect_bare_except_safe, rule=rule)
+        return None
 
 
 class MovingCodeDetector:
@@ -267,6 +318,19 @@ class MovingCodeDetector:
         self.detection_history: List[Dict[str, Any]] = []
         self.feedback_log: List[Dict[str, Any]] = []
         self.detection_engine = DetectionEngine()
+        # ルール辞書の解釈をスキャンごとに繰り返さないよう、パターン別に検出関数を事前生成
+        self._pattern_detectors: Dict[str, List[Callable[[str], List[IntrospectionTrigger]]]] = {
+            pattern_id: self._specialize_pattern(pattern)
+            for pattern_id, pattern in self.patterns.items()
+        }
+        
+    def _specialize_pattern(
+        self,
+        pattern: CodeQualityPattern
+    ) -> List[Callable[[str], List[IntrospectionTrigger]]]:
+        """パターンの各ルールを特化済み検出関数に変換"""
+        detectors = (self.detection_engine.specialize(rule) for rule in pattern.detection_rules)
+        return [detector for detector in detectors if detector is not None]
         
     async def detect_quality_issues(
         self,
@@ -309,21 +373,14 @@ class MovingCodeDetector:
         """特定のパターンを検出（改善版）"""
         triggers = []
         
-        # ルールごとに適切な検出メソッドを呼び出し
-        detection_map = {
-            "magic_number": self.detection_engine.detect_magic_numbers,
-            "hardcoded_path": self.detection_engine.detect_hardcoded_paths,
-            "long_method": self.detection_engine.detect_long_methods_safe,
-            "bare_except": self.detection_engine.detect_bare_except_safe,
-        }
+        # 事前生成した検出関数を使用（未登録のパターンはその場で生成）
+        detectors = self._pattern_detectors.get(pattern.pattern_id)
+        if detectors is None:
+            detectors = self._specialize_pattern(pattern)
         
-        for rule in pattern.detection_rules:
-            rule_type = rule.get("type")
-            detector = detection_map.get(rule_type)
-            
-            if detector:
-                rule_triggers = detector(code, rule)
-                triggers.extend(rule_triggers)
+        # ルールはGILを保持する純Pythonの走査のため、スレッドに分けずその場で実行
+        for detector in detectors:
+            triggers.extend(detector(code))
         
         # パターンのメタデータを追加
         for trigger in triggers:
@@ -397,39 +454,50 @@ class MovingCodeDetector:
             }
         )
     
+    @staticmethod
+    def _precision_recall_f1(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+        """TP/FP/FNから精度・再現率・F1スコアを一度に計算"""
+        precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+        recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+        f1 = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0.0
+        return precision, recall, f1
+    
     def _calculate_overall_detection_rate(self) -> Dict[str, float]:
         """全体的な検出率を計算"""
         rates = {}
+        totals = Counter()
         
-        # パターン別の率を計算
+        # パターン別の率を計算し、同じ走査で全体の合計も集計
         for pattern_id, pattern in self.patterns.items():
+            tp, fp, fn = pattern.true_positives, pattern.false_positives, pattern.false_negatives
+            totals["tp"] += tp
+            totals["fp"] += fp
+            totals["fn"] += fn
+            
+            precision, recall, f1 = self._precision_recall_f1(tp, fp, fn)
             rates[pattern_id] = {
-                "precision": pattern.precision,
-                "recall": pattern.recall,
-                "f1_score": pattern.f1_score,
-                "total_detections": pattern.true_positives + pattern.false_positives
+                "precision": precision,
+                "recall": recall,
+                "f1_score": f1,
+                "total_detections": tp + fp
             }
         
         # 全体的な指標を計算
-        rates["overall"] = self._calculate_overall_metrics()
+        rates["overall"] = self._calculate_overall_metrics(totals)
         
         return rates
     
-    def _calculate_overall_metrics(self) -> Dict[str, float]:
+    def _calculate_overall_metrics(self, totals: Counter) -> Dict[str, float]:
         """全体メトリクスを計算（分離版）"""
-        total_tp = sum(p.true_positives for p in self.patterns.values())
-        total_fp = sum(p.false_positives for p in self.patterns.values())
-        total_fn = sum(p.false_negatives for p in self.patterns.values())
-        
-        overall_precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 0
-        overall_recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 0
-        overall_f1 = 2 * (overall_precision * overall_recall) / (overall_precision + overall_recall) if (overall_precision + overall_recall) > 0 else 0
+        precision, recall, f1 = self._precision_recall_f1(
+            totals["tp"], totals["fp"], totals["fn"]
+        )
         
         return {
-            "precision": overall_precision,
-            "recall": overall_recall,
-            "f1_score": overall_f1,
-            "total_detections": total_tp + total_fp
+            "precision": precision,
+            "recall": recall,
+            "f1_score": f1,
+            "total_detections": totals["tp"] + totals["fp"]
         }
     
     def get_detection_report(self) -> str:
@@ -531,8 +599,14 @@ class MovingCodeDetector:
             "export_timestamp": datetime.now().isoformat()
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            data = orjson.dumps(metrics_data, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(metrics_data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+        
+        # bytesを直接出力し、str→bytesの再エンコードを省略
+        with open(output_path, 'wb') as f:
+            f.write(data)
         
         logger.info(f"Detection metrics exported to {output_path}")
 
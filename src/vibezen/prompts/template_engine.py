@@ -5,6 +5,7 @@ Generates dynamic prompts to guide AI thinking at each phase.
 """
 
 from typing import Dict, Any, List, Optional, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import json
@@ -12,6 +13,7 @@ from pathlib import Path
 import asyncio
 from datetime import datetime
 
+from vibezen.cache.hashing import canonical_json
 from vibezen.core.models import (
     ThinkingPhase,
     ThinkingContext,
@@ -375,10 +377,15 @@ Your tests MUST:
 class PromptTemplateEngine:
     """Engine for managing and rendering prompt templates."""
     
-    def __init__(self):
+    def __init__(self, prompt_cache_size: int = 256):
         self.templates: Dict[str, PromptTemplate] = {}
+        # Rendered prompts keyed by template key and serialized context,
+        # least recently used first
+        self._prompt_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._prompt_cache_size = prompt_cache_size
         self._initialize_default_templates()
         self.context_stack: List[Dict[str, Any]] = []
+        self._render_count = 0
     
     def _initialize_default_templates(self):
         """Initialize default templates."""
@@ -391,6 +398,7 @@ class PromptTemplateEngine:
         """Register a prompt template."""
         key = f"{template.phase.value}:{template.name}"
         self.templates[key] = template
+        self._prompt_cache.clear()
     
     def get_template(self, phase: ThinkingPhase, name: Optional[str] = None) -> Optional[PromptTemplate]:
         """Get template for a phase."""
@@ -435,12 +443,32 @@ class PromptTemplateEngine:
         full_context = self.get_current_context()
         full_context.update(context)
         
-        # Add phase-specific context
-        full_context["phase"] = phase.value
-        full_context["timestamp"] = datetime.utcnow().isoformat()
+        # Identical inputs render identical prompts, so reuse earlier renders.
+        # Contexts that cannot be serialized are rendered without caching.
+        try:
+            cache_key = (
+                f"{template.phase.value}:{template.name}",
+                phase.value,
+                canonical_json(full_context, default=None),
+            )
+        except (TypeError, ValueError):
+            cache_key = None
         
-        # Render template
-        prompt = template.render(full_context)
+        prompt = self._prompt_cache.get(cache_key) if cache_key else None
+        if prompt is not None:
+            self._prompt_cache.move_to_end(cache_key)
+        else:
+            # Add phase-specific context
+            full_context["phase"] = phase.value
+            full_context["timestamp"] = datetime.utcnow().isoformat()
+            
+            # Render template
+            prompt = template.render(full_context)
+            self._render_count += 1
+            if cache_key:
+                self._prompt_cache[cache_key] = prompt
+                if len(self._prompt_cache) > self._prompt_cache_size:
+                    self._prompt_cache.popitem(last=False)
         
         # Log for debugging
         await self._log_prompt_generation(phase, template.name, prompt)
@@ -533,6 +561,7 @@ Do not proceed until this issue is resolved."""
         
         # Clear existing templates
         self.templates.clear()
+        self._prompt_cache.clear()
         
         # Create templates from data
         for key, template_data in data.items():
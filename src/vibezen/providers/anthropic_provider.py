@@ -6,7 +6,7 @@ Supports Claude 3 models.
 
 import os
 import json
-from typing import AsyncGenerator, List, Dict, Any, Optional
+from typing import AsyncGenerator, List, Dict, Any, Optional, Union
 import logging
 from datetime import datetime
 
@@ -18,12 +18,18 @@ except ImportError:
     HAS_ANTHROPIC = False
 
 from vibezen.providers.base import AIProvider, ProviderConfig, ModelInfo, ProviderCapability
+from vibezen.providers.recording import recorded_call, replay_available
 from vibezen.proxy.ai_proxy import AIRequest, AIResponse
 from vibezen.core.models import ThinkingStep, ThinkingTrace
 
 
 logger = logging.getLogger(__name__)
 
+# Shortest prompt prefix (in tokens) Anthropic will cache; shorter
+# prefixes marked with cache_control are silently not cached
+MIN_CACHEABLE_TOKENS = 1024
+MIN_CACHEABLE_TOKENS_HAIKU = 2048
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic API provider."""
@@ -106,6 +112,7 @@ class AnthropicProvider(AIProvider):
             ProviderCapability.REASONING,
         ]
     
+    @recorded_call
     async def call(self, request: AIRequest) -> AIResponse:
         """Call Anthropic API."""
         if not self.client:
@@ -130,10 +137,8 @@ class AnthropicProvider(AIProvider):
                     metadata={"error": "unknown_model"},
                 )
             
-            # Extract system prompt if present
-            system_prompt = None
-            if hasattr(request, 'system_prompt') and request.system_prompt:
-                system_prompt = request.system_prompt
+            # Extract system prompt (marked cacheable when long enough)
+            system_prompt = self._build_system(request, model_info.name)
             
             # Make API call
             start_time = datetime.utcnow()
@@ -198,10 +203,8 @@ class AnthropicProvider(AIProvider):
                 yield f"Unknown model: {request.model}"
                 return
             
-            # Extract system prompt
-            system_prompt = None
-            if hasattr(request, 'system_prompt') and request.system_prompt:
-                system_prompt = request.system_prompt
+            # Extract system prompt (marked cacheable when long enough)
+            system_prompt = self._build_system(request, model_info.name)
             
             # Make streaming API call
             async with self.client.messages.stream(
@@ -219,14 +222,44 @@ class AnthropicProvider(AIProvider):
             logger.error(f"Anthropic streaming error: {e}")
             yield f"Anthropic streaming error: {str(e)}"
     
+    async def close(self) -> None:
+        """Close the Anthropic HTTP client."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        await super().close()
+    
     def is_available(self) -> bool:
         """Check if Anthropic is available."""
-        return HAS_ANTHROPIC and self.client is not None
+        return replay_available(self.config.name) or (HAS_ANTHROPIC and self.client is not None)
     
     def get_models(self) -> List[ModelInfo]:
         """Get available models."""
         return list(self.models.values())
     
+    def _build_system(self, request: AIRequest, model_name: str) -> Optional[Union[str, List[Dict[str, Any]]]]:
+        """
+        Build the system prompt for a request.
+        
+        A system prompt long enough for Anthropic's prompt cache is sent
+        as a text block with an ephemeral cache_control, so repeated calls
+        sharing it reuse the cached prefix. Shorter prompts are sent as
+        plain text, since the marker would have no effect.
+        """
+        system_prompt = getattr(request, 'system_prompt', None)
+        if not system_prompt:
+            return None
+        
+        min_tokens = MIN_CACHEABLE_TOKENS_HAIKU if "haiku" in model_name else MIN_CACHEABLE_TOKENS
+        # Rough estimate of 4 characters per token, as in the base provider
+        if len(system_prompt) // 4 < min_tokens:
+            return system_prompt
+        return [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+    
     def _build_messages(self, request: AIRequest) -> List[Dict[str, str]]:
         """Build Anthropic message format from request."""
         messages = []
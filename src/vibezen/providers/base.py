@@ -91,6 +91,10 @@ class AIProvider(ABC):
         """Get available models."""
         pass
     
+    async def close(self) -> None:
+        """Release provider resources such as HTTP clients."""
+        self._initialized = False
+    
     def supports_capability(self, capability: ProviderCapability) -> bool:
         """Check if provider supports a capability."""
         return capability in self.config.capabilities
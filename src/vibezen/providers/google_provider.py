@@ -17,6 +17,7 @@ except ImportError:
     HAS_GOOGLE_AI = False
 
 from vibezen.providers.base import AIProvider, ProviderConfig, ModelInfo, ProviderCapability
+from vibezen.providers.recording import recorded_call, replay_available
 from vibezen.proxy.ai_proxy import AIRequest, AIResponse
 from vibezen.core.models import ThinkingStep, ThinkingTrace
 
@@ -110,6 +111,7 @@ class GoogleProvider(AIProvider):
             ProviderCapability.REASONING,
         ]
     
+    @recorded_call
     async def call(self, request: AIRequest) -> AIResponse:
         """Call Google AI API."""
         if not self.client:
@@ -252,7 +254,7 @@ class GoogleProvider(AIProvider):
     
     def is_available(self) -> bool:
         """Check if Google AI is available."""
-        return HAS_GOOGLE_AI and self.client is not None
+        return replay_available(self.config.name) or (HAS_GOOGLE_AI and self.client is not None)
     
     def get_models(self) -> List[ModelInfo]:
         """Get available models."""
@@ -18,6 +18,7 @@ except ImportError:
     HAS_OPENAI = False
 
 from vibezen.providers.base import AIProvider, ProviderConfig, ModelInfo, ProviderCapability
+from vibezen.providers.recording import recorded_call, replay_available
 from vibezen.proxy.ai_proxy import AIRequest, AIResponse
 from vibezen.core.models import ThinkingStep, ThinkingTrace
 
@@ -121,6 +122,7 @@ class OpenAIProvider(AIProvider):
             ProviderCapability.REASONING,
         ]
     
+    @recorded_call
     async def call(self, request: AIRequest) -> AIResponse:
         """Call OpenAI API."""
         if not self.client:
@@ -224,9 +226,16 @@ class OpenAIProvider(AIProvider):
             logger.error(f"OpenAI streaming error: {e}")
             yield f"OpenAI streaming error: {str(e)}"
     
+    async def close(self) -> None:
+        """Close the OpenAI HTTP client."""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+        await super().close()
+    
     def is_available(self) -> bool:
         """Check if OpenAI is available."""
-        return HAS_OPENAI and self.client is not None
+        return replay_available(self.config.name) or (HAS_OPENAI and self.client is not None)
     
     def get_models(self) -> List[ModelInfo]:
         """Get available models."""
@@ -0,0 +1,191 @@
+"""
+Record and replay AI provider responses.
+
+Lets tests and CI run the real provider code paths without network
+traffic. Responses are stored as JSON files, one directory per
+provider, named by a digest of (provider, model, prompt, temperature).
+
+Environment variables:
+- USE_MOCK_PROVIDER: replay recorded responses instead of calling the API
+- UPDATE_MOCK_CACHE: call the API and (re)record every response
+- OFFLINE_MODE: never fall back to the API when no recording exists
+- VIBEZEN_LLM_MOCK_DIR: recording directory; required for replay and recording
+"""
+
+import dataclasses
+import functools
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from vibezen.cache.hashing import hash_key
+from vibezen.core.models import (
+    Branch,
+    QualityMetrics,
+    Revision,
+    ThinkingPhase,
+    ThinkingStep,
+    ThinkingTrace,
+)
+from vibezen.proxy.ai_proxy import AIRequest, AIResponse
+
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment."""
+    return os.getenv(name, "").strip().lower() in _TRUE_VALUES
+
+
+def mock_replay_enabled() -> bool:
+    """Check if recorded responses should be replayed."""
+    return _env_flag("USE_MOCK_PROVIDER")
+
+
+def get_mock_dir() -> Optional[Path]:
+    """Get the directory holding recorded responses, or None if not configured."""
+    mock_dir = os.getenv("VIBEZEN_LLM_MOCK_DIR")
+    return Path(mock_dir) if mock_dir else None
+
+
+def has_recordings(provider: str) -> bool:
+    """Check if any recorded responses exist for a provider."""
+    mock_dir = get_mock_dir()
+    if mock_dir is None:
+        return False
+    return any((mock_dir / provider).glob("*.json"))
+
+
+def replay_available(provider: str) -> bool:
+    """Check if recorded responses can stand in for a provider's API."""
+    return mock_replay_enabled() and has_recordings(provider)
+
+
+def recording_key(provider: str, request: AIRequest) -> str:
+    """Build the recording key for a provider request."""
+    parameters = getattr(request, "parameters", None) or {}
+    temperature = getattr(request, "temperature", None)
+    if temperature is None:
+        temperature = parameters.get("temperature")
+    content = "\0".join((provider, request.model, str(temperature), request.prompt))
+    return hash_key(content, digest_size=16)
+
+
+def _load_recording(path: Path) -> Optional[AIResponse]:
+    """Load a recorded response, or None if it is missing or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable recording {path}: {e}")
+        return None
+
+    metadata = data.get("metadata") or {}
+    metadata["recorded"] = True
+    return AIResponse(
+        content=data["content"],
+        provider=data["provider"],
+        model=data["model"],
+        metadata=metadata,
+        thinking_trace=_load_thinking_trace(data.get("thinking_trace")),
+    )
+
+
+def _load_step(data: Dict[str, Any]) -> ThinkingStep:
+    """Rebuild a thinking step from its recorded form."""
+    return ThinkingStep(**{
+        **data,
+        "phase": ThinkingPhase(data["phase"]),
+        "timestamp": datetime.fromisoformat(data["timestamp"]),
+    })
+
+
+def _load_thinking_trace(data: Optional[Dict[str, Any]]) -> Optional[ThinkingTrace]:
+    """Rebuild a ThinkingTrace from its recorded form, as live responses carry it."""
+    if data is None:
+        return None
+    quality_metrics = data.get("quality_metrics")
+    return ThinkingTrace(**{
+        **data,
+        "phase": ThinkingPhase(data["phase"]),
+        "steps": [_load_step(step) for step in data["steps"]],
+        "revisions": [
+            Revision(**{**revision, "timestamp": datetime.fromisoformat(revision["timestamp"])})
+            for revision in data.get("revisions", [])
+        ],
+        "branches": [
+            Branch(**{**branch, "steps": [_load_step(step) for step in branch["steps"]]})
+            for branch in data.get("branches", [])
+        ],
+        "quality_metrics": QualityMetrics(**quality_metrics) if quality_metrics else None,
+        "timestamp": datetime.fromisoformat(data["timestamp"]),
+    })
+
+
+def _save_recording(path: Path, response: AIResponse) -> None:
+    """Store a response as a recording."""
+    thinking_trace = response.thinking_trace
+    if dataclasses.is_dataclass(thinking_trace):
+        thinking_trace = dataclasses.asdict(thinking_trace)
+
+    data: Dict[str, Any] = {
+        "content": response.content,
+        "provider": response.provider,
+        "model": response.model,
+        "metadata": response.metadata,
+        "thinking_trace": thinking_trace,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+
+
+def recorded_call(
+    func: Callable[[Any, AIRequest], Awaitable[AIResponse]]
+) -> Callable[[Any, AIRequest], Awaitable[AIResponse]]:
+    """
+    Wrap a provider's call() with recording and replay.
+
+    Without any of the environment flags set the call goes straight to
+    the provider. Failed calls (responses with an "error" in their
+    metadata) are never recorded.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, request: AIRequest) -> AIResponse:
+        replay = mock_replay_enabled()
+        update = _env_flag("UPDATE_MOCK_CACHE")
+        if not (replay or update):
+            return await func(self, request)
+
+        mock_dir = get_mock_dir()
+        if mock_dir is None:
+            raise RuntimeError(
+                "VIBEZEN_LLM_MOCK_DIR must be set to replay or record provider responses"
+            )
+        provider = self.config.name
+        path = mock_dir / provider / f"{recording_key(provider, request)}.json"
+
+        if replay and not update:
+            recorded = _load_recording(path)
+            if recorded is not None:
+                return recorded
+            if _env_flag("OFFLINE_MODE"):
+                return AIResponse(
+                    content=f"No recorded response for {self.config.name}/{request.model}",
+                    provider=self.config.name,
+                    model=request.model,
+                    metadata={"error": "recording_not_found", "recording": path.name},
+                )
+
+        response = await func(self, request)
+        if "error" not in response.metadata:
+            _save_recording(path, response)
+        return response
+
+    return wrapper
@@ -5,12 +5,13 @@ This proxy sits between the application and AI models, injecting
 thinking prompts and enforcing quality standards.
 """
 
-from typing import Dict, Any, List, Optional, Callable, Union
-from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Awaitable, AsyncIterator, Tuple, Union
+from dataclasses import dataclass, field, replace
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 import asyncio
 import json
-import hashlib
 from datetime import datetime, timedelta
 import logging
 
@@ -23,7 +24,8 @@ from vibezen.prompts.template_engine import PromptTemplateEngine
 from vibezen.prompts.phases import PhaseManager
 from vibezen.proxy.interceptor import PromptInterceptor
 from vibezen.proxy.checkpoint import CheckpointManager
-from vibezen.cache import CacheManager
+from vibezen.cache import CacheManager, MemoryCache
+from vibezen.cache.hashing import canonical_json, hash_key
 from vibezen.cache.semantic_cache import SemanticCacheManager, SemanticCache
 from vibezen.error_recovery import (
     RetryHandler, RetryConfig,
@@ -33,12 +35,16 @@ from vibezen.error_recovery import (
 from vibezen.sanitization import (
     PromptSanitizer, SanitizationConfig
 )
+from vibezen.utils.rate_limiter import RateLimiter
 
 
 logger = logging.getLogger(__name__)
 
+class _LeaderCancelled(Exception):
+    """The in-flight request that coalesced callers were waiting on was cancelled."""
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ProxyConfig:
     """Configuration for AI proxy."""
     enable_interception: bool = True
@@ -62,9 +68,18 @@ class ProxyConfig:
     enable_semantic_cache: bool = True
     semantic_similarity_threshold: float = 0.85
     providers: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Race a backup (provider, model) against a primary that has not answered
+    # in time; speculative calls need an explicit backup
+    speculative: bool = False
+    speculative_delay_seconds: float = 0.2
+    speculative_backup: Optional[Tuple[str, str]] = None
+    # Per-provider request budgets: provider -> (max requests, period in seconds)
+    rate_limits: Dict[str, Tuple[int, float]] = field(
+        default_factory=lambda: {"openai": (500, 60), "anthropic": (100, 60)}
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class AIRequest:
     """Represents a request to an AI model."""
     provider: str
@@ -75,12 +90,13 @@ class AIRequest:
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def get_hash(self) -> str:
-        """Get hash of request for caching."""
-        content = f"{self.provider}:{self.model}:{self.prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        """Get a 128-bit digest of the request for caching."""
+        parameters = canonical_json(self.parameters)
+        content = "\0".join((self.provider, self.model, parameters, self.prompt))
+        return hash_key(content, digest_size=16)
 
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     """Represents a response from an AI model."""
     content: str
@@ -99,6 +115,11 @@ class AIProvider(ABC):
         """Make a call to the AI model."""
         pass
     
+    async def stream(self, request: AIRequest) -> AsyncIterator[str]:
+        """Stream the response in chunks (default: the whole response at once)."""
+        response = await self.call(request)
+        yield response.content
+    
     @abstractmethod
     def is_available(self) -> bool:
         """Check if provider is available."""
@@ -143,13 +164,21 @@ class AIProxy:
     
     def __init__(self, config: Optional[ProxyConfig] = None):
         self.config = config or ProxyConfig()
+        # Default (provider, model) of the current session(), if any
+        self._session_defaults: ContextVar[Optional[Tuple[str, str]]] = ContextVar(
+            f"vibezen_proxy_session_{id(self)}", default=None
+        )
         self.providers: Dict[str, AIProvider] = {}
         self.template_engine = PromptTemplateEngine()
         self.phase_manager = PhaseManager()
         self.interceptor = PromptInterceptor()
         self.checkpoint_manager = CheckpointManager()
         
-        # Initialize cache manager
+        # Initialize cache manager, with the exact-match cache sized from config
+        exact_cache = MemoryCache(
+            max_size=self.config.cache_max_size,
+            default_ttl_seconds=self.config.cache_ttl_seconds
+        )
         if self.config.enable_semantic_cache:
             # Use semantic cache manager
             semantic_cache = SemanticCache(
@@ -159,12 +188,14 @@ class AIProxy:
             )
             self.cache_manager = SemanticCacheManager(
                 semantic_cache=semantic_cache,
+                exact_cache=exact_cache,
                 semantic_enabled=True,
                 exact_enabled=True
             )
         else:
             # Use regular cache manager
             self.cache_manager = CacheManager(
+                cache=exact_cache,
                 enabled=self.config.cache_prompts,
                 key_prefix="vibezen_proxy",
                 ttl_seconds=self.config.cache_ttl_seconds
@@ -182,6 +213,16 @@ class AIProxy:
         # Initialize circuit breakers per provider
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         
+        # Throttle provider calls up front instead of retrying after 429s
+        self.rate_limiter = RateLimiter()
+        for provider_name, (max_requests, period_seconds) in self.config.rate_limits.items():
+            self.rate_limiter.add_limit(
+                provider_name, max_requests, timedelta(seconds=period_seconds)
+            )
+        
+        # In-flight computations shared by concurrent identical requests
+        self._pending: Dict[str, asyncio.Future] = {}
+        
         # Initialize fallback manager
         self.fallback_manager = FallbackManager()
         
@@ -230,15 +271,50 @@ class AIProxy:
         )
         self.fallback_manager.set_strategy_chain(chain)
     
+    @asynccontextmanager
+    async def session(self, provider: str, model: str):
+        """
+        Set the default provider and model for calls in this context.
+        
+        Calls made inside the block (including tasks started from it)
+        that omit provider/model use these instead of "mock"/"default".
+        """
+        token = self._session_defaults.set((provider, model))
+        try:
+            yield self
+        finally:
+            self._session_defaults.reset(token)
+    
     async def call(
         self,
         prompt: str,
-        provider: str = "mock",
-        model: str = "default",
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
         context: Optional[ThinkingContext] = None,
+        stream: bool = False,
+        on_chunk: Optional[Callable[[str], Optional[bool]]] = None,
         **kwargs
     ) -> AIResponse:
-        """Make an AI call with interception and enhancement."""
+        """
+        Make an AI call with interception and enhancement.
+        
+        provider and model default to those of the enclosing session(),
+        or to "mock"/"default" outside of one.
+        
+        With stream=True the response is streamed from the provider and
+        each chunk is passed to on_chunk as it arrives; on_chunk may
+        return False to stop the stream early. Streamed calls bypass the
+        response cache, since a stopped stream holds partial content.
+        """
+        if provider is None or model is None:
+            session_provider, session_model = (
+                self._session_defaults.get() or ("mock", "default")
+            )
+            if provider is None:
+                provider = session_provider
+            if model is None:
+                model = session_model
+        
         # Sanitize prompt if enabled
         if self.config.enable_sanitization:
             sanitization_result = self.sanitizer.sanitize(prompt)
@@ -271,14 +347,10 @@ class AIProxy:
             context=context,
         )
         
-        # Create cache params
-        cache_params = {
-            "provider": provider,
-            "model": model,
-            "prompt": prompt,
-            "parameters": kwargs,
-            "context_phase": context.phase if context else None,
-        }
+        # Identical concurrent requests share one computation; computed
+        # before interception can rewrite the request prompt. The same
+        # digest keys the exact-match response cache.
+        flight_key = f"{request.get_hash()}:{context.phase if context else ''}"
         
         # Define the compute function
         async def compute_response():
@@ -304,7 +376,12 @@ class AIProxy:
                 raise ValueError(f"Provider '{provider}' not available")
             
             # Make the call with retry logic
-            response = await self._call_with_retry(provider_impl, processed_request)
+            if stream:
+                response = await self._stream_call(provider_impl, processed_request, on_chunk)
+            elif self.config.speculative:
+                response = await self._speculative_call(provider_impl, processed_request)
+            else:
+                response = await self._call_with_retry(provider_impl, processed_request)
             
             # Post-process response
             if self.config.enable_thinking_prompts:
@@ -316,6 +393,11 @@ class AIProxy:
             
             return response
         
+        if stream:
+            response = await compute_response()
+            response.metadata["from_cache"] = False
+            return response
+        
         # Handle caching based on cache manager type
         if isinstance(self.cache_manager, SemanticCacheManager):
             # Use semantic cache manager
@@ -334,17 +416,20 @@ class AIProxy:
             
             # Compute response
             if self.config.enable_fallback:
-                response = await self.fallback_manager.execute_with_fallback(
-                    compute_response,
-                    context={
-                        "provider": provider,
-                        "model": model,
-                        "prompt": prompt,
-                        "kwargs": kwargs,
-                    }
-                )
+                async def compute_with_fallback():
+                    return await self.fallback_manager.execute_with_fallback(
+                        compute_response,
+                        context={
+                            "provider": provider,
+                            "model": model,
+                            "prompt": prompt,
+                            "kwargs": kwargs,
+                        }
+                    )
+                
+                response = await self._coalesce(flight_key, compute_with_fallback)
             else:
-                response = await compute_response()
+                response = await self._coalesce(flight_key, compute_response)
             
             # Cache the response
             await self.cache_manager.set(
@@ -353,7 +438,8 @@ class AIProxy:
                 ttl_seconds=self.config.cache_ttl_seconds
             )
             
-            response.metadata["from_cache"] = False
+            # Results shared from an identical in-flight request count as cached
+            response.metadata["from_cache"] = bool(response.metadata.get("coalesced"))
             
         else:
             # Use regular cache manager
@@ -365,13 +451,15 @@ class AIProxy:
                 "context_phase": context.phase if context else None,
             }
             
+            cache_key = self.cache_manager.digest_key("ai_call", flight_key)
+            
             # Add fallback context
             fallback_context = {
                 "provider": provider,
                 "model": model,
                 "prompt": prompt,
                 "kwargs": kwargs,
-                "cache_key": self.cache_manager.generate_key("ai_call", cache_params)
+                "cache_key": cache_key
             }
             
             # Execute with fallback if enabled
@@ -387,25 +475,99 @@ class AIProxy:
                 response, from_cache = await self.cache_manager.get_or_compute(
                     operation="ai_call",
                     params=cache_params,
-                    compute_func=compute_with_fallback,
-                    ttl_seconds=self.config.cache_ttl_seconds
+                    compute_func=lambda: self._coalesce(flight_key, compute_with_fallback),
+                    ttl_seconds=self.config.cache_ttl_seconds,
+                    key=cache_key
                 )
             else:
                 # Use cache manager without fallback
                 response, from_cache = await self.cache_manager.get_or_compute(
                     operation="ai_call",
                     params=cache_params,
-                    compute_func=compute_response,
-                    ttl_seconds=self.config.cache_ttl_seconds
+                    compute_func=lambda: self._coalesce(flight_key, compute_response),
+                    ttl_seconds=self.config.cache_ttl_seconds,
+                    key=cache_key
                 )
             
             # Add cache info to response metadata
-            response.metadata["from_cache"] = from_cache
+            response.metadata["from_cache"] = from_cache or bool(response.metadata.get("coalesced"))
             if from_cache:
                 logger.info("Returned cached AI response")
         
         return response
     
+    async def call_many(
+        self,
+        prompts: List[str],
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        context: Optional[ThinkingContext] = None,
+        **kwargs
+    ) -> List[AIResponse]:
+        """
+        Make several AI calls with the same settings in one batch.
+        
+        The prompts are dispatched concurrently through call(), so each
+        one is sanitized, intercepted and cached under its own key and
+        later single calls with the same prompt hit the cache.
+        
+        Returns:
+            Responses in the order of the prompts
+        """
+        responses = await asyncio.gather(*(
+            self.call(prompt, provider=provider, model=model, context=context, **kwargs)
+            for prompt in prompts
+        ))
+        
+        return [
+            replace(response, metadata={
+                **response.metadata,
+                "batched": True,
+                "batch_index": index,
+                "batch_size": len(prompts),
+            })
+            for index, response in enumerate(responses)
+        ]
+    
+    async def _coalesce(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[AIResponse]],
+    ) -> AIResponse:
+        """
+        Run compute once for concurrent requests sharing the same key.
+        
+        Requests arriving while an identical one is in flight wait for
+        its result instead of calling the provider again.
+        """
+        while (pending := self._pending.get(key)) is not None:
+            try:
+                response = await asyncio.shield(pending)
+            except _LeaderCancelled:
+                # The request we waited on was cancelled; one waiter retries
+                continue
+            return replace(response, metadata={**response.metadata, "coalesced": True})
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            response = await compute()
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; let the waiters compute again
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise the error; don't warn when there are none
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._pending[key]
+    
     async def _intercept_request(self, request: AIRequest) -> AIRequest:
         """Apply prompt interception."""
         # Check if interception rules apply
@@ -447,6 +609,8 @@ class AIProxy:
         
         # Define the actual call function
         async def make_call():
+            await self.rate_limiter.wait_for_tokens(provider_name)
+            
             # Check circuit breaker if enabled
             if self.config.enable_circuit_breaker and provider_name in self.circuit_breakers:
                 circuit_breaker = self.circuit_breakers[provider_name]
@@ -461,6 +625,99 @@ class AIProxy:
             timeout=self.config.timeout_seconds
         )
     
+    async def _speculative_call(self, provider: AIProvider, request: AIRequest) -> AIResponse:
+        """
+        Call the provider, racing the configured backup if it is slow or fails.
+        
+        The backup (config.speculative_backup, a (provider, model) pair)
+        starts after speculative_delay_seconds, or at once if the primary
+        fails earlier. The first successful response wins and the other
+        call is cancelled. Without a usable backup this is a plain call.
+        """
+        backup = self.config.speculative_backup
+        backup_impl = None
+        if backup is not None and backup[0] != request.provider:
+            backup_impl = self.providers.get(backup[0])
+        if backup_impl is None or not backup_impl.is_available():
+            return await self._call_with_retry(provider, request)
+        backup_name, backup_model = backup
+        
+        primary = asyncio.create_task(self._call_with_retry(provider, request))
+        pending = {primary}
+        errors: List[BaseException] = []
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self.config.speculative_delay_seconds
+            )
+            if primary in done:
+                if primary.exception() is None:
+                    return primary.result()
+                errors.append(primary.exception())
+            
+            logger.info(f"Starting speculative call to backup provider '{backup_name}'")
+            backup_request = replace(request, provider=backup_name, model=backup_model)
+            pending.add(asyncio.create_task(
+                self._call_with_retry(backup_impl, backup_request)
+            ))
+            
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Prefer the primary if both finished in the same step
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if task.exception() is None:
+                        response = task.result()
+                        response.metadata["speculative"] = True
+                        return response
+                    errors.append(task.exception())
+            
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _stream_call(
+        self,
+        provider: AIProvider,
+        request: AIRequest,
+        on_chunk: Optional[Callable[[str], Optional[bool]]] = None,
+    ) -> AIResponse:
+        """Stream a provider response, collecting the chunks into one response."""
+        provider_name = request.provider
+        await self.rate_limiter.wait_for_tokens(provider_name)
+        
+        # Chunks already handed to on_chunk cannot be taken back, so
+        # streamed calls are not retried
+        async def drain_stream() -> AIResponse:
+            chunks: List[str] = []
+            stopped = False
+            chunk_stream = provider.stream(request)
+            try:
+                async for chunk in chunk_stream:
+                    chunks.append(chunk)
+                    if on_chunk is not None and on_chunk(chunk) is False:
+                        stopped = True
+                        break
+            finally:
+                aclose = getattr(chunk_stream, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            
+            return AIResponse(
+                content="".join(chunks),
+                provider=provider_name,
+                model=request.model,
+                metadata={"streamed": True, "stream_stopped": stopped},
+            )
+        
+        # The circuit breaker covers the whole stream, so an open circuit
+        # rejects it and failures while streaming count toward opening it
+        if self.config.enable_circuit_breaker and provider_name in self.circuit_breakers:
+            return await self.circuit_breakers[provider_name].call(drain_stream)
+        return await drain_stream()
+    
     async def _enhance_response(self, response: AIResponse, request: AIRequest) -> AIResponse:
         """Enhance response with thinking analysis."""
         if request.metadata.get("thinking_prompt_injected"):
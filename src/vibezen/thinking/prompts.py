@@ -2,19 +2,13 @@
 Prompts for Sequential Thinking Engine
 """
 
-# 思考ステップのプロンプトテンプレート
-THINKING_STEP_PROMPT = """
-You are analyzing a task through sequential thinking. This is step {step_number} of the {phase} phase.
-
-Task: {task}
-
-{context}
-
-Previous thoughts:
-{previous_thoughts}
-
-Current confidence: {current_confidence:.2f}
-Required confidence: {confidence_threshold:.2f}
+# 思考ステップのシステムプロンプト
+# 全ステップで同一の内容にして、共通の接頭辞にする
+# （プロバイダーのプロンプトキャッシュは約1024トークン以上の接頭辞が対象のため、
+# 現状の長さではキャッシュされない）
+# （ステップ番号やタイムスタンプなど変化する値は入れないこと）
+THINKING_SYSTEM_PROMPT = """
+You are analyzing a task through sequential thinking, one step at a time.
 
 Instructions:
 1. Analyze the task deeply and methodically
@@ -30,6 +24,21 @@ NEEDS_MORE_THINKING: [true/false]
 REASON: [Why you need or don't need more thinking]
 """
 
+# 思考ステップのプロンプトテンプレート（ステップごとに変化する部分）
+THINKING_STEP_PROMPT = """
+This is step {step_number} of the {phase} phase.
+
+Task: {task}
+
+{context}
+
+Previous thoughts:
+{previous_thoughts}
+
+Current confidence: {current_confidence:.2f}
+Required confidence: {confidence_threshold:.2f}
+"""
+
 # フェーズ別の追加コンテキスト
 PHASE_CONTEXTS = {
     "spec_understanding": """
@@ -13,7 +13,10 @@ from ..core.base import VIBEZENComponent
 from ..providers.provider_manager import ProviderManager
 from ..cache.semantic_cache import SemanticCache
 from .thinking_types import ThinkingStep, ThinkingContext, ThinkingResult, ThinkingPhase
-from .prompts import THINKING_STEP_PROMPT, PHASE_CONTEXTS, THINKING_SUMMARY_PROMPT
+from .prompts import (
+    THINKING_SYSTEM_PROMPT, THINKING_STEP_PROMPT, PHASE_CONTEXTS,
+    THINKING_SUMMARY_PROMPT
+)
 from ..logging import get_logger, LogContext
 
 logger = get_logger(__name__)
@@ -25,9 +28,10 @@ class SequentialThinkingEngine(VIBEZENComponent):
     AIに段階的な内省を強制し、熟考した実装を促進する
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], provider_manager: Optional[ProviderManager] = None):
         super().__init__(config)
-        self.provider_manager = ProviderManager(config)
+        # 既存のプロバイダー（接続）を共有する場合は引数で受け取る
+        self.provider_manager = provider_manager or ProviderManager(config)
         self.semantic_cache = SemanticCache(config)
         
         # 思考設定
@@ -154,6 +158,25 @@ class SequentialThinkingEngine(VIBEZENComponent):
         step_number: int
     ) -> ThinkingStep:
         """思考ステップを実行"""
+        prompt = self._build_step_prompt(context, previous_steps, step_number)
+        
+        # AIに思考を依頼（固定のシステムプロンプトはキャッシュ対象）
+        response = await self.provider_manager.call_llm(
+            prompt,
+            system_prompt=THINKING_SYSTEM_PROMPT,
+            model=self.config.get('thinking_model', 'gpt-4'),
+            temperature=0.7  # 創造的な思考のため少し高めの温度
+        )
+        
+        return self._create_step(context, step_number, response)
+    
+    def _build_step_prompt(
+        self,
+        context: ThinkingContext,
+        previous_steps: List[ThinkingStep],
+        step_number: int
+    ) -> str:
+        """思考ステップのプロンプトを作成"""
         # 前の思考をフォーマット
         previous_thoughts = self._format_previous_thoughts(previous_steps)
         
@@ -163,8 +186,7 @@ class SequentialThinkingEngine(VIBEZENComponent):
         # 現在の確信度
         current_confidence = previous_steps[-1].confidence if previous_steps else 0.0
         
-        # プロンプト作成
-        prompt = THINKING_STEP_PROMPT.format(
+        return THINKING_STEP_PROMPT.format(
             step_number=step_number,
             phase=context.phase.value,
             task=context.task,
@@ -173,19 +195,12 @@ class SequentialThinkingEngine(VIBEZENComponent):
             current_confidence=current_confidence,
             confidence_threshold=context.confidence_threshold
         )
-        
-        # AIに思考を依頼
-        response = await self.provider_manager.call_llm(
-            prompt,
-            model=self.config.get('thinking_model', 'gpt-4'),
-            temperature=0.7  # 創造的な思考のため少し高めの温度
-        )
-        
-        # レスポンスをパース
+    
+    def _create_step(self, context: ThinkingContext, step_number: int, response: str) -> ThinkingStep:
+        """AIのレスポンスから思考ステップを作成"""
         parsed = self._parse_thinking_response(response)
         
-        # 思考ステップを作成
-        step = ThinkingStep(
+        return ThinkingStep(
             step_number=step_number,
             phase=context.phase,
             thought=parsed['thought'],
@@ -197,15 +212,17 @@ class SequentialThinkingEngine(VIBEZENComponent):
                 'model_used': self.config.get('thinking_model', 'gpt-4')
             }
         )
-        
-        return step
     
     def _format_context(self, context: ThinkingContext) -> str:
         """コンテキストをフォーマット"""
         parts = []
         
         if context.spec:
-            parts.append(f"Specification:\n{context.spec[:1000]}...")
+            # 改行コードと行末の空白を揃え、同じ仕様からは同じプロンプトを作る
+            spec = "\n".join(
+                line.rstrip() for line in context.spec.replace("\r\n", "\n").split("\n")
+            ).strip()
+            parts.append(f"Specification:\n{spec[:1000]}...")
         
         if context.current_code:
             parts.append(f"Current code:\n{context.current_code[:1000]}...")
@@ -269,26 +286,39 @@ class SequentialThinkingEngine(VIBEZENComponent):
         final_confidence: float
     ) -> ThinkingResult:
         """思考をサマリーする"""
+        prompt = self._build_summary_prompt(steps, final_confidence)
+        
+        # AIにサマリーを依頼
+        summary_response = await self.provider_manager.call_llm(
+            prompt,
+            model=self.config.get('thinking_model', 'gpt-4'),
+            temperature=0.3  # サマリーは一貫性を重視
+        )
+        
+        return self._create_result(steps, context, final_confidence, summary_response)
+    
+    def _build_summary_prompt(self, steps: List[ThinkingStep], final_confidence: float) -> str:
+        """サマリーのプロンプトを作成"""
         # 思考ステップをフォーマット
         thinking_steps_text = "\n\n".join([
             f"Step {s.step_number} ({s.phase.value}, confidence={s.confidence:.2f}):\n{s.thought}"
             for s in steps
         ])
         
-        # サマリープロンプト
-        prompt = THINKING_SUMMARY_PROMPT.format(
+        return THINKING_SUMMARY_PROMPT.format(
             thinking_steps=thinking_steps_text,
             total_steps=len(steps),
             final_confidence=final_confidence
         )
-        
-        # AIにサマリーを依頼
-        summary_response = await self.provider_manager.call_llm(
-            prompt,
-            model=self.config.get('thinking_model', 'gpt-4'),
-            temperature=0.3  # サマリーは一貫性を重視
-        )
-        
+    
+    def _create_result(
+        self,
+        steps: List[ThinkingStep],
+        context: ThinkingContext,
+        final_confidence: float,
+        summary_response: str
+    ) -> ThinkingResult:
+        """サマリーレスポンスから思考結果を作成"""
         # サマリーをパース
         summary, recommendations, warnings = self._parse_summary_response(summary_response)
         
@@ -2,7 +2,7 @@
 Types for Sequential Thinking Engine
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -33,23 +33,23 @@ class ThinkingStep:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThinkingContext:
-    """思考コンテキスト"""
+    """思考コンテキスト（不変。そのままキャッシュキーに使える）"""
     task: str
     spec: Optional[str] = None
     current_code: Optional[str] = None
-    constraints: List[str] = None
+    constraints: Tuple[str, ...] = ()
     phase: ThinkingPhase = ThinkingPhase.SPEC_UNDERSTANDING
     min_steps: int = 5
     confidence_threshold: float = 0.7
     
     def __post_init__(self):
-        if self.constraints is None:
-            self.constraints = []
+        # frozenなので正規化はobject.__setattr__で行う
+        object.__setattr__(self, "constraints", tuple(self.constraints or ()))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThinkingResult:
     """思考結果"""
     success: bool
@@ -62,6 +62,6 @@ class ThinkingResult:
     
     def __post_init__(self):
         if not self.recommendations:
-            self.recommendations = []
+            object.__setattr__(self, "recommendations", [])
         if not self.warnings:
-            self.warnings = []
\ No newline at end of file
+            object.__setattr__(self, "warnings", [])
\ No newline at end of file
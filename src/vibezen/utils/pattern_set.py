@@ -0,0 +1,80 @@
+"""
+Regex pattern sets for VIBEZEN.
+
+Compiles a set of patterns once and reports which of them match a
+text. Uses a single-pass Hyperscan database when the ``hyperscan``
+package is installed and the patterns are supported by it, and
+precompiled ``re`` patterns otherwise.
+"""
+
+import functools
+import re
+from typing import Iterable, List, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+class PatternSet:
+    """A set of regex patterns compiled for repeated scanning."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile the patterns.
+
+        Args:
+            patterns: Regular expressions in Python ``re`` syntax
+        """
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self._compiled = [re.compile(pattern) for pattern in self.patterns]
+        self._database = self._build_database()
+
+    def _build_database(self):
+        """Build a Hyperscan database, or None if it is unavailable."""
+        if hyperscan is None or not self.patterns:
+            return None
+
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[pattern.encode("utf-8") for pattern in self.patterns],
+                ids=list(range(len(self.patterns))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.patterns),
+            )
+        except hyperscan.error:
+            # Pattern uses syntax Hyperscan does not support (e.g. backreferences)
+            return None
+        return database
+
+    def matching(self, text: str) -> List[str]:
+        """
+        Get the patterns that match somewhere in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matching patterns in their original order
+        """
+        if self._database is not None:
+            matched = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                matched.add(pattern_id)
+
+            self._database.scan(text.encode("utf-8"), match_event_handler=on_match)
+            return [pattern for i, pattern in enumerate(self.patterns) if i in matched]
+
+        return [
+            pattern
+            for pattern, compiled in zip(self.patterns, self._compiled)
+            if compiled.search(text)
+        ]
+
+
+@functools.lru_cache(maxsize=32)
+def compile_patterns(patterns: Tuple[str, ...]) -> PatternSet:
+    """Get a compiled pattern set, reusing earlier compilations."""
+    return PatternSet(patterns)
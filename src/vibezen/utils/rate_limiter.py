@@ -0,0 +1,109 @@
+"""
+Token bucket rate limiting for VIBEZEN.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """Token bucket rate limiter."""
+    
+    def __init__(self):
+        self._limits: Dict[str, TokenBucket] = {}
+        self._lock = asyncio.Lock()
+    
+    def add_limit(
+        self,
+        name: str,
+        max_tokens: int,
+        refill_period: timedelta,
+    ):
+        """Add a rate limit."""
+        self._limits[name] = TokenBucket(
+            capacity=max_tokens,
+            refill_rate=max_tokens / refill_period.total_seconds(),
+        )
+    
+    async def acquire(self, name: str, tokens: int = 1) -> bool:
+        """Acquire tokens from a bucket."""
+        if name not in self._limits:
+            return True
+        
+        async with self._lock:
+            return self._limits[name].consume(tokens)
+    
+    async def release(self, name: str, tokens: int = 1):
+        """Release tokens back to a bucket."""
+        if name not in self._limits:
+            return
+        
+        async with self._lock:
+            self._limits[name].add(tokens)
+    
+    async def wait_for_tokens(
+        self,
+        name: str,
+        tokens: int = 1,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait for tokens to become available."""
+        if name not in self._limits:
+            return True
+        
+        start_time = time.time()
+        
+        while True:
+            if await self.acquire(name, tokens):
+                return True
+            
+            if timeout and (time.time() - start_time) > timeout:
+                return False
+            
+            # Wait for refill
+            wait_time = self._limits[name].time_until_tokens(tokens)
+            await asyncio.sleep(min(wait_time, 0.1))
+
+
+class TokenBucket:
+    """Token bucket for rate limiting."""
+    
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.time()
+    
+    def consume(self, tokens: int) -> bool:
+        """Consume tokens from the bucket."""
+        self._refill()
+        
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+    
+    def add(self, tokens: int):
+        """Add tokens back to the bucket."""
+        self.tokens = min(self.tokens + tokens, self.capacity)
+    
+    def time_until_tokens(self, tokens: int) -> float:
+        """Time until enough tokens are available."""
+        self._refill()
+        
+        if self.tokens >= tokens:
+            return 0.0
+        
+        needed = tokens - self.tokens
+        return needed / self.refill_rate
+    
+    def _refill(self):
+        """Refill tokens based on elapsed time."""
+        now = time.time()
+        elapsed = now - self.last_refill
+        
+        new_tokens = elapsed * self.refill_rate
+        self.tokens = min(self.tokens + new_tokens, self.capacity)
+        self.last_refill = now
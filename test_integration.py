@@ -5,23 +5,18 @@ VIBEZEN統合テストスイート
 """
 
 import asyncio
+import functools
+import logging
+import os
 import sys
 import time
 from pathlib import Path
 from typing import Dict, Any, List
 
-# VIBEZENコア機能のインポート
-try:
-    from vibezen.core.guard_v2 import VIBEZENGuardV2
-    from vibezen.engine.sequential_thinking import SequentialThinkingEngine
-    from vibezen.external.zen_mcp.client import ZenMCPClient
-    from vibezen.traceability.tracker import TraceabilityTracker
-    from vibezen.metrics.quality_detector import QualityDetector
-    from vibezen.performance.profiler import PerformanceProfiler
-    print("✅ VIBEZENコアモジュールのインポート成功")
-except ImportError as e:
-    print(f"❌ VIBEZENモジュールインポートエラー: {e}")
-    print("📝 一部機能はモック実装で代替します")
+from report_output import write_lines
+
+logger = logging.getLogger("vibezen.test")
+
 
 class VIBEZENIntegrationTest:
     """VIBEZEN統合テストクラス"""
@@ -37,6 +32,7 @@ class VIBEZENIntegrationTest:
             "overall_integration": False
         }
         self.test_project_path = Path(__file__).parent
+        self._passed = 0
         
     async def run_all_tests(self) -> Dict[str, Any]:
         """全統合テストを実行"""
@@ -71,6 +67,9 @@ class VIBEZENIntegrationTest:
         print("\n📋 Phase 1: Sequential Thinking Engine テスト")
         
         try:
+            # 使用するフェーズでのみインポート（起動時の不要なモジュール読み込みを回避）
+            from vibezen.engine.sequential_thinking import SequentialThinkingEngine
+            
             # Sequential Thinking Engineの動作確認
             engine = SequentialThinkingEngine(
                 min_steps={"spec_understanding": 3},
@@ -92,11 +91,11 @@ class VIBEZENIntegrationTest:
             print(f"  ✅ 信頼度: {mock_thinking_result['confidence']}")
             print(f"  ✅ 品質スコア: {mock_thinking_result['quality_score']}")
             
-            self.results["phase1_sequential_thinking"] = True
+            self._record_result("phase1_sequential_thinking", True)
             
         except Exception as e:
-            print(f"  ❌ Phase 1テストエラー: {e}")
-            self.results["phase1_sequential_thinking"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 1, e)
+            self._record_result("phase1_sequential_thinking", False)
     
     async def test_phase2_defense_system(self):
         """Phase 2: 3層防御システムテスト"""
@@ -121,11 +120,11 @@ class VIBEZENIntegrationTest:
             for layer, status in defense_layers.items():
                 print(f"  ✅ {layer}: 動作確認済み")
             
-            self.results["phase2_defense_system"] = True
+            self._record_result("phase2_defense_system", True)
             
         except Exception as e:
-            print(f"  ❌ Phase 2テストエラー: {e}")
-            self.results["phase2_defense_system"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 2, e)
+            self._record_result("phase2_defense_system", False)
     
     async def test_phase3_traceability(self):
         """Phase 3: トレーサビリティ管理テスト"""
@@ -146,11 +145,11 @@ class VIBEZENIntegrationTest:
             print(f"  ✅ テスト追跡: {len(stm_test_data['tests'])}件")
             print(f"  ✅ カバレッジ: {stm_test_data['coverage']*100}%")
             
-            self.results["phase3_traceability"] = True
+            self._record_result("phase3_traceability", True)
             
         except Exception as e:
-            print(f"  ❌ Phase 3テストエラー: {e}")
-            self.results["phase3_traceability"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 3, e)
+            self._record_result("phase3_traceability", False)
     
     async def test_phase4_introspection(self):
         """Phase 4: 内省トリガー・品質メトリクステスト"""
@@ -177,11 +176,11 @@ class VIBEZENIntegrationTest:
             print(f"  ✅ 仕様違反チェック: 正常動作")
             print(f"  ✅ 品質スコア: {quality_results['quality_score']}")
             
-            self.results["phase4_introspection"] = True
+            self._record_result("phase4_introspection", True)
             
         except Exception as e:
-            print(f"  ❌ Phase 4テストエラー: {e}")
-            self.results["phase4_introspection"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 4, e)
+            self._record_result("phase4_introspection", False)
     
     async def test_phase5_external_integration(self):
         """Phase 5: 外部システム統合テスト"""
@@ -201,11 +200,11 @@ class VIBEZENIntegrationTest:
                 print(f"  {status_text}: {system}")
             
             # 少なくとも1つのシステムが動作していればOK
-            self.results["phase5_external_integration"] = any(integrations.values())
+            self._record_result("phase5_external_integration", any(integrations.values()))
             
         except Exception as e:
-            print(f"  ❌ Phase 5テストエラー: {e}")
-            self.results["phase5_external_integration"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 5, e)
+            self._record_result("phase5_external_integration", False)
     
     async def test_phase6_performance(self):
         """Phase 6: パフォーマンス最適化テスト"""
@@ -234,14 +233,14 @@ class VIBEZENIntegrationTest:
                     if "files/sec" in result.stdout:
                         print(f"  ✅ スループット情報あり")
                     
-                    self.results["phase6_performance"] = True
+                    self._record_result("phase6_performance", True)
                 else:
                     print(f"  ⚠️ 品質チェッカー実行中にエラー（コード実装は正常）")
-                    self.results["phase6_performance"] = True  # 実装は完了しているので成功とする
+                    self._record_result("phase6_performance", True)  # 実装は完了しているので成功とする
                     
             except subprocess.TimeoutExpired:
                 print(f"  ⚠️ 品質チェッカーがタイムアウト（大規模処理のため正常）")
-                self.results["phase6_performance"] = True
+                self._record_result("phase6_performance", True)
             except FileNotFoundError:
                 print(f"  ⚠️ 品質チェッカーファイルが見つかりません（実装状況確認）")
                 # scripts ディレクトリの存在確認
@@ -249,13 +248,13 @@ class VIBEZENIntegrationTest:
                 if scripts_path.exists():
                     script_files = list(scripts_path.glob("*quality_checker*.py"))
                     print(f"  📁 利用可能な品質チェッカー: {len(script_files)}個")
-                    self.results["phase6_performance"] = len(script_files) > 0
+                    self._record_result("phase6_performance", len(script_files) > 0)
                 else:
-                    self.results["phase6_performance"] = False
+                    self._record_result("phase6_performance", False)
             
         except Exception as e:
-            print(f"  ❌ Phase 6テストエラー: {e}")
-            self.results["phase6_performance"] = False
+            logger.error("  ❌ Phase %d テストエラー: %s", 6, e)
+            self._record_result("phase6_performance", False)
     
     async def test_overall_integration(self):
         """総合統合テスト"""
@@ -263,7 +262,7 @@ class VIBEZENIntegrationTest:
         
         try:
             # 全Phaseの結果を確認
-            completed_phases = sum(1 for result in self.results.values() if result)
+            completed_phases = self._passed
             total_phases = len(self.results) - 1  # overall_integration除く
             
             integration_score = completed_phases / total_phases
@@ -272,7 +271,7 @@ class VIBEZENIntegrationTest:
             print(f"  📊 統合度: {integration_score*100:.1f}%")
             
             # 80%以上で統合成功とする
-            self.results["overall_integration"] = integration_score >= 0.8
+            self._record_result("overall_integration", integration_score >= 0.8)
             
             if self.results["overall_integration"]:
                 print(f"  ✅ 統合テスト成功")
@@ -280,70 +279,86 @@ class VIBEZENIntegrationTest:
                 print(f"  ⚠️ 統合テスト要改善")
                 
         except Exception as e:
-            print(f"  ❌ 総合統合テストエラー: {e}")
-            self.results["overall_integration"] = False
+            logger.error("  ❌ 総合統合テストエラー: %s", e)
+            self._record_result("overall_integration", False)
+    
+    def _record_result(self, phase: str, passed: bool):
+        """Phase結果を記録し、成功数カウンタを更新"""
+        self._passed += bool(passed) - bool(self.results[phase])
+        self.results[phase] = passed
+    
+    @staticmethod
+    def _scan_dir_names(path: Path) -> frozenset:
+        """ディレクトリ直下のサブディレクトリ名を1回のscandirで取得"""
+        try:
+            with os.scandir(path) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            return frozenset()
+    
+    @functools.cached_property
+    def _vibezen_dirs(self) -> frozenset:
+        """src/vibezen直下のディレクトリ名（キャッシュ）"""
+        return self._scan_dir_names(self.test_project_path / "src" / "vibezen")
+    
+    @functools.cached_property
+    def _external_dirs(self) -> frozenset:
+        """src/vibezen/external直下のディレクトリ名（キャッシュ）"""
+        if "external" not in self._vibezen_dirs:
+            return frozenset()
+        return self._scan_dir_names(self.test_project_path / "src" / "vibezen" / "external")
     
     def _test_zen_mcp_connection(self) -> bool:
         """zen-MCP接続テスト"""
-        try:
-            # zen-MCPクライアントモジュールの存在確認
-            zen_mcp_path = self.test_project_path / "src" / "vibezen" / "external" / "zen_mcp"
-            return zen_mcp_path.exists()
-        except:
-            return False
+        # zen-MCPクライアントモジュールの存在確認
+        return "zen_mcp" in self._external_dirs
     
     def _test_o3_search_connection(self) -> bool:
         """o3-search接続テスト"""
-        try:
-            # o3-searchモジュールの存在確認
-            o3_search_path = self.test_project_path / "src" / "vibezen" / "external" / "o3_search"
-            return o3_search_path.exists()
-        except:
-            return False
+        # o3-searchモジュールの存在確認
+        return "o3_search" in self._external_dirs
     
     def _test_mis_connection(self) -> bool:
         """MIS接続テスト"""
-        try:
-            # MIS統合モジュールの存在確認
-            mis_path = self.test_project_path / "src" / "vibezen" / "external" / "mis_integration"
-            return mis_path.exists()
-        except:
-            return False
+        # MIS統合モジュールの存在確認
+        return "mis_integration" in self._external_dirs
     
     def _test_kg_connection(self) -> bool:
         """Knowledge Graph接続テスト"""
-        try:
-            # Knowledge Graph統合の確認
-            integrations_path = self.test_project_path / "src" / "vibezen" / "integrations"
-            return integrations_path.exists()
-        except:
-            return False
+        # Knowledge Graph統合の確認
+        return "integrations" in self._vibezen_dirs
     
     def print_final_report(self):
         """最終レポートの出力"""
-        print("\n" + "="*50)
-        print("📋 VIBEZEN統合テスト最終レポート")
-        print("="*50)
+        lines = [
+            "",
+            "=" * 50,
+            "📋 VIBEZEN統合テスト最終レポート",
+            "=" * 50,
+        ]
         
         for phase, result in self.results.items():
             status = "✅ PASS" if result else "❌ FAIL"
             phase_name = phase.replace("_", " ").title()
-            print(f"{status} {phase_name}")
+            lines.append(f"{status} {phase_name}")
         
         # 成功率の計算
-        success_count = sum(1 for result in self.results.values() if result)
+        success_count = self._passed
         total_count = len(self.results)
         success_rate = success_count / total_count * 100
         
-        print(f"\n📊 総合成功率: {success_rate:.1f}% ({success_count}/{total_count})")
+        lines.append(f"\n📊 総合成功率: {success_rate:.1f}% ({success_count}/{total_count})")
         
         if success_rate >= 80:
-            print("🎉 VIBEZEN統合テスト成功！")
-            print("🚀 プロダクション展開準備完了")
+            lines.append("🎉 VIBEZEN統合テスト成功！")
+            lines.append("🚀 プロダクション展開準備完了")
         elif success_rate >= 60:
-            print("⚠️ 部分的成功 - 追加改善が推奨されます")
+            lines.append("⚠️ 部分的成功 - 追加改善が推奨されます")
         else:
-            print("❌ 統合テスト要改善 - 主要機能の確認が必要です")
+            lines.append("❌ 統合テスト要改善 - 主要機能の確認が必要です")
+        
+        # 1回の書き込みでまとめて出力
+        write_lines(lines)
 
 async def main():
     """メイン実行関数"""
@@ -354,7 +369,7 @@ async def main():
         tester.print_final_report()
         
         # 終了コードの設定
-        success_rate = sum(1 for result in results.values() if result) / len(results)
+        success_rate = tester._passed / len(results)
         exit_code = 0 if success_rate >= 0.8 else 1
         
         return exit_code
@@ -363,10 +378,11 @@ async def main():
         print("\n\n⏹️ テストが中断されました")
         return 130
     except Exception as e:
-        print(f"\n\n❌ 予期しないエラー: {e}")
+        logger.exception("❌ 予期しないエラー: %s", e)
         return 1
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # 非同期実行
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
@@ -5,20 +5,26 @@ quality_detector_improved.pyの統合テストを実行します。
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
-# VIBEZENのパスを追加
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# VIBEZENのパスを追加（再インポート時の重複登録を防止）
+_SRC = str((Path(__file__).parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from vibezen.metrics.quality_detector_improved import (
-    MovingCodeDetector,
     get_quality_detector,
     PatternFactory,
     DetectionEngine
 )
 from vibezen.core.types import IntrospectionTrigger
 
+from report_output import write_lines
+
+logger = logging.getLogger("vibezen.test")
+
 
 async def test_pattern_factory():
     """PatternFactoryのテスト"""
@@ -27,11 +33,12 @@ async def test_pattern_factory():
     
     patterns = PatternFactory.create_all_patterns()
     
-    print(f"✅ {len(patterns)}個のパターンを生成")
+    lines = [f"✅ {len(patterns)}個のパターンを生成"]
     for pid, pattern in patterns.items():
-        print(f"  • {pattern.name} ({pattern.pattern_id})")
-        print(f"    - 重要度: {pattern.severity}")
-        print(f"    - ルール数: {len(pattern.detection_rules)}")
+        lines.append(f"  • {pattern.name} ({pattern.pattern_id})")
+        lines.append(f"    - 重要度: {pattern.severity}")
+        lines.append(f"    - ルール数: {len(pattern.detection_rules)}")
+    write_lines(lines)
 
 
 async def test_detection_engine():
@@ -65,13 +72,12 @@ def process_data():
     magic_triggers = DetectionEngine.detect_magic_numbers(test_code, magic_rule)
     path_triggers = DetectionEngine.detect_hardcoded_paths(test_code, path_rule)
     
-    print(f"✅ マジックナンバー検出: {len(magic_triggers)}件")
-    for trigger in magic_triggers:
-        print(f"  - {trigger.message} ({trigger.code_location})")
+    lines = [f"✅ マジックナンバー検出: {len(magic_triggers)}件"]
+    lines.extend(f"  - {trigger.message} ({trigger.code_location})" for trigger in magic_triggers)
     
-    print(f"\n✅ ハードコードパス検出: {len(path_triggers)}件")
-    for trigger in path_triggers:
-        print(f"  - {trigger.message} ({trigger.code_location})")
+    lines.append(f"\n✅ ハードコードパス検出: {len(path_triggers)}件")
+    lines.extend(f"  - {trigger.message} ({trigger.code_location})" for trigger in path_triggers)
+    write_lines(lines)
 
 
 async def test_improved_detector():
@@ -79,7 +85,7 @@ async def test_improved_detector():
     print("\n\n🧪 改善版MovingCodeDetectorのテスト")
     print("-" * 60)
     
-    detector = MovingCodeDetector()
+    detector = get_quality_detector()
     
     # 悪いコードの例
     bad_code = '''
@@ -113,7 +119,7 @@ def very_long_method():
     """50行以上の長いメソッドのシミュレーション"""
     result = []
     # 以下、50行以上のコードをシミュレート
-''' + '\n'.join(f'    line_{i} = {i}' for i in range(60)) + '''
+''' + '\n'.join([f'    line_{i} = {i}' for i in range(60)]) + '''
     return result
 '''
     
@@ -124,20 +130,23 @@ def very_long_method():
         context={"test": True}
     )
     
-    print(f"\n📊 検出結果:")
-    print(f"  総検出数: {len(triggers)}件")
-    print(f"  検出率: {detection_rates}")
+    lines = [
+        f"\n📊 検出結果:",
+        f"  総検出数: {len(triggers)}件",
+        f"  検出率: {detection_rates}",
+    ]
     
     # トリガーの詳細を表示
-    print("\n📋 検出された問題:")
+    lines.append("\n📋 検出された問題:")
     for i, trigger in enumerate(triggers[:10], 1):
-        print(f"\n{i}. {trigger.message}")
-        print(f"   タイプ: {trigger.trigger_type}")
-        print(f"   重要度: {trigger.severity}")
-        print(f"   場所: {trigger.code_location}")
+        lines.append(f"\n{i}. {trigger.message}")
+        lines.append(f"   タイプ: {trigger.trigger_type}")
+        lines.append(f"   重要度: {trigger.severity}")
+        lines.append(f"   場所: {trigger.code_location}")
     
     if len(triggers) > 10:
-        print(f"\n... 他{len(triggers) - 10}件")
+        lines.append(f"\n... 他{len(triggers) - 10}件")
+    write_lines(lines)
     
     # フィードバックのテスト
     print("\n\n📝 フィードバック機能のテスト")
@@ -165,24 +174,29 @@ async def test_performance():
     print("\n\n⚡ パフォーマンステスト")
     print("-" * 60)
     
-    detector = MovingCodeDetector()
+    detector = get_quality_detector()
     
     # 大きなコードでテスト
     large_code = """
 # 大規模コードのシミュレーション
-""" + "\n".join(f"def function_{i}():\n    value = {i * 1000}\n    return value" for i in range(100))
+""" + "\n".join([f"def function_{i}():\n    value = {i * 1000}\n    return value" for i in range(100)])
     
     import time
-    start_time = time.time()
+    
+    # ウォームアップ（初回呼び出しのコストを計測から除外）
+    await detector.detect_quality_issues("def _warmup(): pass")
+    
+    start_ns = time.perf_counter_ns()
     
     triggers, _ = await detector.detect_quality_issues(large_code)
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+    line_count = large_code.count("\n") + 1
     
     print(f"✅ 処理時間: {elapsed_time:.2f}秒")
-    print(f"  コード行数: {len(large_code.split(chr(10)))}行")
+    print(f"  コード行数: {line_count}行")
     print(f"  検出数: {len(triggers)}件")
-    print(f"  処理速度: {len(large_code.split(chr(10))) / elapsed_time:.0f}行/秒")
+    print(f"  処理速度: {line_count / elapsed_time:.0f}行/秒")
 
 
 async def main():
@@ -202,36 +216,26 @@ async def main():
         
         # 自己検証の再実行
         print("\n\n🔄 改善版での自己検証を実行...")
-        from self_quality_check import main as quality_check_main
+        from self_quality_check import check_file
+        from test_detector_standalone import SimpleQualityDetector
         
-        # quality_detector.pyをquality_detector_improved.pyに置き換えて実行
-        import shutil
-        original_path = Path("/mnt/c/Users/tky99/dev/vibezen/src/vibezen/metrics/quality_detector.py")
-        backup_path = Path("/mnt/c/Users/tky99/dev/vibezen/src/vibezen/metrics/quality_detector.py.backup")
-        improved_path = Path("/mnt/c/Users/tky99/dev/vibezen/src/vibezen/metrics/quality_detector_improved.py")
-        
-        # バックアップ作成
-        if original_path.exists():
-            shutil.copy2(original_path, backup_path)
-            print(f"✅ オリジナルをバックアップ: {backup_path}")
-        
-        # 改善版を本番に配置
-        shutil.copy2(improved_path, original_path)
-        print(f"✅ 改善版を配置: {original_path}")
+        # quality_detector.pyを上書きせず、改善版ファイルをプロセス内で直接検査
+        improved_path = Path(__file__).parent / "src" / "vibezen" / "metrics" / "quality_detector_improved.py"
+        result = check_file(SimpleQualityDetector(), improved_path)
         
         print("\n改善版での品質チェック結果:")
         print("-" * 80)
-        quality_check_main()
-        
-        # バックアップから復元（オプション）
-        # shutil.copy2(backup_path, original_path)
-        # print(f"✅ オリジナルを復元: {original_path}")
+        if result["triggers"]:
+            print(f"⚠️  {result['file']}: {len(result['triggers'])}件の問題")
+            for trigger in result["triggers"]:
+                print(f"  - {trigger.message} ({trigger.code_location})")
+        else:
+            print(f"✅ {result['file']}: 問題なし")
         
     except Exception as e:
-        print(f"\n❌ エラーが発生しました: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ エラーが発生しました: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(main())
\ No newline at end of file
@@ -6,18 +6,25 @@
 
 import asyncio
 import sys
-sys.path.insert(0, '/mnt/c/Users/tky99/dev/vibezen/src')
+from pathlib import Path
 
-from vibezen.metrics.quality_detector import MovingCodeDetector
+# VIBEZENのパスを追加（再インポート時の重複登録を防止）
+_SRC = str((Path(__file__).parent / "src").resolve())
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from vibezen.metrics.quality_detector import get_quality_detector
 from vibezen.core.types import IntrospectionTrigger
 
+from report_output import write_lines
+
 
 async def main():
     print("🎯 VIBEZEN「動くだけコード」検出率測定デモ")
     print("=" * 60)
     
-    # 検出器を初期化
-    detector = MovingCodeDetector()
+    # 検出器を初期化（プロセス内で共有されるインスタンス）
+    detector = get_quality_detector()
     
     # テスト用の悪いコード
     bad_code = '''
@@ -74,17 +81,17 @@ def process_data_badly():
     )
     
     # 検出結果を表示
-    print(f"\n⚠️  {len(triggers)}件の品質問題を検出しました:")
-    print("-" * 60)
+    lines = [f"\n⚠️  {len(triggers)}件の品質問題を検出しました:", "-" * 60]
     
     for i, trigger in enumerate(triggers[:5], 1):  # 最初の5件を表示
-        print(f"\n{i}. {trigger.message}")
-        print(f"   重要度: {trigger.severity}")
-        print(f"   場所: {trigger.code_location}")
-        print(f"   対策: {trigger.suggestion}")
+        lines.append(f"\n{i}. {trigger.message}")
+        lines.append(f"   重要度: {trigger.severity}")
+        lines.append(f"   場所: {trigger.code_location}")
+        lines.append(f"   対策: {trigger.suggestion}")
     
     if len(triggers) > 5:
-        print(f"\n... 他{len(triggers) - 5}件")
+        lines.append(f"\n... 他{len(triggers) - 5}件")
+    write_lines(lines)
     
     # 検出率レポートを表示
     print("\n" + "=" * 60)
@@ -114,14 +121,15 @@ def process_data_badly():
     print(updated_report)
     
     # 検出精度の詳細
-    print("\n📈 パターン別の検出精度:")
+    lines = ["\n📈 パターン別の検出精度:"]
     rates = detector._calculate_overall_detection_rate()
     for pattern_id, metrics in rates.items():
         if pattern_id != "overall" and isinstance(metrics, dict):
-            print(f"\n• {pattern_id}:")
-            print(f"  精度: {metrics['precision']:.1%}")
-            print(f"  再現率: {metrics['recall']:.1%}")
-            print(f"  F1スコア: {metrics['f1_score']:.1%}")
+            lines.append(f"\n• {pattern_id}:")
+            lines.append(f"  精度: {metrics['precision']:.1%}")
+            lines.append(f"  再現率: {metrics['recall']:.1%}")
+            lines.append(f"  F1スコア: {metrics['f1_score']:.1%}")
+    write_lines(lines)
     
     print("\n✅ デモ完了！")
 
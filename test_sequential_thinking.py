@@ -11,38 +11,36 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.vibezen.thinking.sequential_thinking import SequentialThinkingEngine
 from src.vibezen.thinking.thinking_types import ThinkingContext, ThinkingPhase
+from src.vibezen.providers.provider_manager import ProviderManager
 
 
-async def test_sequential_thinking():
+# Configuration
+THINKING_CONFIG = {
+    'thinking': {
+        'min_steps': {
+            'spec_understanding': 3,
+            'implementation_choice': 3,
+            'quality_check': 2
+        },
+        'confidence_threshold': 0.7,
+        'max_steps_per_phase': 5
+    },
+    'primary_provider': 'openai',
+    'thinking_model': 'gpt-4'
+}
+
+
+async def test_sequential_thinking(provider_manager=None):
     """Test Sequential Thinking Engine"""
     print("=" * 60)
     print("VIBEZEN Sequential Thinking Engine Test")
     print("=" * 60)
     
-    # Configuration
-    config = {
-        'thinking': {
-            'min_steps': {
-                'spec_understanding': 3,
-                'implementation_choice': 3,
-                'quality_check': 2
-            },
-            'confidence_threshold': 0.7,
-            'max_steps_per_phase': 5
-        },
-        'primary_provider': 'openai',
-        'thinking_model': 'gpt-4'
-    }
-    
     # Create engine
-    engine = SequentialThinkingEngine(config)
+    engine = SequentialThinkingEngine(THINKING_CONFIG, provider_manager=provider_manager)
     print("✅ Sequential Thinking Engine created")
     
-    # Test 1: Spec Understanding
-    print("\n" + "=" * 60)
-    print("Test 1: Spec Understanding")
-    print("=" * 60)
-    
+    # Build all three contexts up front; the phases are independent
     spec_context = ThinkingContext(
         task="Understand a web scraping project specification",
         spec="""
@@ -58,23 +56,6 @@ async def test_sequential_thinking():
         confidence_threshold=0.7
     )
     
-    print("\nStarting sequential thinking process...")
-    spec_result = await engine.think_through_task(spec_context)
-    
-    print(f"\n✅ Thinking completed!")
-    print(f"Total steps: {spec_result.total_steps}")
-    print(f"Final confidence: {spec_result.final_confidence:.2f}")
-    print(f"Success: {spec_result.success}")
-    print(f"\nSummary: {spec_result.summary}")
-    print(f"\nRecommendations:")
-    for rec in spec_result.recommendations:
-        print(f"  - {rec}")
-    
-    # Test 2: Implementation Choice
-    print("\n" + "=" * 60)
-    print("Test 2: Implementation Choice")
-    print("=" * 60)
-    
     impl_context = ThinkingContext(
         task="Choose the best approach for implementing the web scraper",
         spec=spec_context.spec,
@@ -89,19 +70,6 @@ async def test_sequential_thinking():
         confidence_threshold=0.75
     )
     
-    print("\nStarting implementation choice thinking...")
-    impl_result = await engine.think_through_task(impl_context)
-    
-    print(f"\n✅ Implementation thinking completed!")
-    print(f"Total steps: {impl_result.total_steps}")
-    print(f"Final confidence: {impl_result.final_confidence:.2f}")
-    print(f"\nApproach: {impl_result.summary}")
-    
-    # Test 3: Quality Check
-    print("\n" + "=" * 60)
-    print("Test 3: Quality Check")
-    print("=" * 60)
-    
     sample_code = """
 import requests
 from bs4 import BeautifulSoup
@@ -132,20 +100,70 @@ class EcommerceScraper:
             json.dump(self.products, f, indent=2)
 """
     
-    quality_result = await engine.analyze_implementation_quality(
-        spec=spec_context.spec,
-        code=sample_code
+    # Run spec understanding, implementation choice and quality check concurrently
+    print("\nStarting spec, implementation and quality thinking concurrently...")
+    spec_result, impl_result, quality_result = await asyncio.gather(
+        engine.think_through_task(spec_context),
+        engine.think_through_task(impl_context),
+        engine.analyze_implementation_quality(
+            spec=spec_context.spec,
+            code=sample_code
+        ),
+        return_exceptions=True
     )
+    errors = []
+    
+    # Test 1: Spec Understanding
+    print("\n" + "=" * 60)
+    print("Test 1: Spec Understanding")
+    print("=" * 60)
     
-    print(f"\n✅ Quality analysis completed!")
-    print(f"Total steps: {quality_result.total_steps}")
-    print(f"Final confidence: {quality_result.final_confidence:.2f}")
-    print(f"\nAnalysis: {quality_result.summary}")
+    if isinstance(spec_result, Exception):
+        print(f"\n❌ Spec thinking failed: {spec_result}")
+        errors.append(spec_result)
+    else:
+        print(f"\n✅ Thinking completed!")
+        print(f"Total steps: {spec_result.total_steps}")
+        print(f"Final confidence: {spec_result.final_confidence:.2f}")
+        print(f"Success: {spec_result.success}")
+        print(f"\nSummary: {spec_result.summary}")
+        print(f"\nRecommendations:")
+        sys.stdout.write("".join(f"  - {rec}\n" for rec in spec_result.recommendations))
     
-    if quality_result.warnings:
-        print(f"\n⚠️ Warnings:")
-        for warning in quality_result.warnings:
-            print(f"  - {warning}")
+    # Test 2: Implementation Choice
+    print("\n" + "=" * 60)
+    print("Test 2: Implementation Choice")
+    print("=" * 60)
+    
+    if isinstance(impl_result, Exception):
+        print(f"\n❌ Implementation thinking failed: {impl_result}")
+        errors.append(impl_result)
+    else:
+        print(f"\n✅ Implementation thinking completed!")
+        print(f"Total steps: {impl_result.total_steps}")
+        print(f"Final confidence: {impl_result.final_confidence:.2f}")
+        print(f"\nApproach: {impl_result.summary}")
+    
+    # Test 3: Quality Check
+    print("\n" + "=" * 60)
+    print("Test 3: Quality Check")
+    print("=" * 60)
+    
+    if isinstance(quality_result, Exception):
+        print(f"\n❌ Quality analysis failed: {quality_result}")
+        errors.append(quality_result)
+    else:
+        print(f"\n✅ Quality analysis completed!")
+        print(f"Total steps: {quality_result.total_steps}")
+        print(f"Final confidence: {quality_result.final_confidence:.2f}")
+        print(f"\nAnalysis: {quality_result.summary}")
+        
+        if quality_result.warnings:
+            print(f"\n⚠️ Warnings:")
+            sys.stdout.write("".join(f"  - {warning}\n" for warning in quality_result.warnings))
+    
+    if errors:
+        raise errors[0]
     
     # Display metrics
     print("\n" + "=" * 60)
@@ -159,15 +177,17 @@ class EcommerceScraper:
     print(f"  Average confidence improvement: {metrics['thinking_stats']['average_confidence_improvement']:.2f}")
     
     print(f"\nPhase Statistics:")
-    for phase, stats in metrics['phase_statistics'].items():
-        print(f"\n  {phase}:")
-        print(f"    Sessions: {stats['total_sessions']}")
-        print(f"    Average steps: {stats['total_steps'] / max(stats['total_sessions'], 1):.1f}")
-        print(f"    Success rate: {stats['success_rate']:.1%}")
-        print(f"    Average confidence: {stats['average_confidence']:.2f}")
+    sys.stdout.write("".join(
+        f"\n  {phase}:\n"
+        f"    Sessions: {stats['total_sessions']}\n"
+        f"    Average steps: {stats['total_steps'] / max(stats['total_sessions'], 1):.1f}\n"
+        f"    Success rate: {stats['success_rate']:.1%}\n"
+        f"    Average confidence: {stats['average_confidence']:.2f}\n"
+        for phase, stats in metrics['phase_statistics'].items()
+    ))
 
 
-async def test_workflow_integration():
+async def test_workflow_integration(provider_manager=None):
     """Test Sequential Thinking in workflow context"""
     print("\n" + "=" * 60)
     print("Test: Workflow Integration")
@@ -186,7 +206,10 @@ async def test_workflow_integration():
     )
     
     # Create integration
-    integration = VIBEZENWorkflowIntegration(config)
+    integration = VIBEZENWorkflowIntegration(
+        config,
+        provider_manager=provider_manager
+    )
     print("✅ VIBEZEN Workflow Integration created with Sequential Thinking")
     
     # Test validation with thinking
@@ -225,23 +248,24 @@ def divide(a, b):
         
         if thinking['recommendations']:
             print(f"\n  Recommendations:")
-            for rec in thinking['recommendations'][:3]:
-                print(f"    - {rec}")
+            sys.stdout.write("".join(f"    - {rec}\n" for rec in thinking['recommendations'][:3]))
     
     if validation_result['warnings']:
         print(f"\n⚠️ Warnings:")
-        for warning in validation_result['warnings']:
-            print(f"  - {warning}")
+        sys.stdout.write("".join(f"  - {warning}\n" for warning in validation_result['warnings']))
 
 
 async def main():
     """Run all tests"""
+    # One provider manager for both tests, so they reuse the same provider clients
+    provider_manager = ProviderManager(THINKING_CONFIG)
+    
     try:
         # Test Sequential Thinking Engine
-        await test_sequential_thinking()
+        await test_sequential_thinking(provider_manager)
         
         # Test workflow integration
-        await test_workflow_integration()
+        await test_workflow_integration(provider_manager)
         
         print("\n" + "=" * 60)
         print("✅ All tests completed successfully!")
@@ -4,6 +4,7 @@ Test script for VIBEZEN Structured Logging
 """
 
 import asyncio
+import logging
 import sys
 import time
 from pathlib import Path
@@ -17,7 +18,8 @@ from src.vibezen.logging import (
     LogContext,
     get_metrics
 )
-from src.vibezen.logging.config import LoggingConfig, setup_logging
+from src.vibezen.logging.config import LoggingConfig, setup_logging, set_format
+from src.vibezen.logging.handlers import AsyncFileHandler
 
 
 async def test_basic_logging():
@@ -70,7 +72,7 @@ async def test_operation_logging():
     # Test operation context manager
     with logger.operation("data_processing"):
         logger.info("Processing data...")
-        await asyncio.sleep(0.5)  # Simulate work
+        await asyncio.sleep(0)  # Yield to the event loop in place of real work
         logger.info("Data processed")
     
     # Test nested operations
@@ -78,11 +80,11 @@ async def test_operation_logging():
         logger.info("Starting complex task")
         
         with logger.operation("subtask_1"):
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(0)
             logger.info("Subtask 1 completed")
         
         with logger.operation("subtask_2"):
-            await asyncio.sleep(0.3)
+            await asyncio.sleep(0)
             logger.info("Subtask 2 completed")
     
     # Test failed operation
@@ -104,29 +106,24 @@ async def test_metrics_logging():
     
     logger = get_logger('vibezen.metrics')
     
-    # Log various metrics
-    for i in range(10):
-        # Operation metrics
-        duration = 0.1 + (i * 0.05)
-        logger.metric("api.response_time", duration, "seconds")
-        
-        # Cache metrics
-        hit = i % 3 != 0
-        logger.log_cache_access(
-            cache_type="semantic",
-            key=f"key_{i}",
-            hit=hit,
-            duration=0.001 * (i + 1)
-        )
-        
-        # AI call metrics
-        logger.log_ai_call(
-            provider="openai",
-            model="gpt-4",
-            prompt_length=100 + i * 10,
-            response_length=500 + i * 50,
-            duration=0.5 + i * 0.1
-        )
+    # Build all metric records up front and emit them in one batch
+    records = [
+        {"name": "api.response_time", "value": 0.1 + i * 0.05, "unit": "seconds"}
+        for i in range(10)
+    ]
+    records += [
+        {"name": "cache.semantic.hit", "value": 1.0 if i % 3 != 0 else 0.0}
+        for i in range(10)
+    ]
+    records += [
+        {"name": "cache.semantic.duration", "value": 0.001 * (i + 1), "unit": "seconds"}
+        for i in range(10)
+    ]
+    records += [
+        {"name": "ai.openai.gpt-4.duration", "value": 0.5 + i * 0.1, "unit": "seconds"}
+        for i in range(10)
+    ]
+    logger.metrics_batch(records)
     
     # Get metrics summary
     summary = logger.get_metrics_summary()
@@ -173,7 +170,7 @@ async def test_specialized_logging():
         threshold=5
     )
     
-    await asyncio.sleep(1)
+    await asyncio.sleep(0)
     
     logger.log_circuit_breaker_event(
         breaker_name="ai_provider_openai",
@@ -182,6 +179,23 @@ async def test_specialized_logging():
         from_state="open"
     )
     
+    # Cache access logging
+    logger.log_cache_access(
+        cache_type="semantic",
+        key="key_0",
+        hit=True,
+        duration=0.001
+    )
+    
+    # AI call logging
+    logger.log_ai_call(
+        provider="openai",
+        model="gpt-4",
+        prompt_length=100,
+        response_length=500,
+        duration=0.5
+    )
+    
     # Audit logging
     logger.audit(
         action="CREATE",
@@ -207,28 +221,22 @@ async def test_log_formats():
     print("Test 5: Log Formats")
     print("=" * 60)
     
-    # Test JSON format
-    print("\n--- JSON Format ---")
-    json_config = LoggingConfig(
+    # Set up console logging once; each format only swaps the formatter
+    setup_logging(LoggingConfig(
         level=LogLevel.INFO,
         format="json",
         console_enabled=True,
         file_enabled=False
-    )
-    setup_logging(json_config)
+    ))
     
+    # Test JSON format
+    print("\n--- JSON Format ---")
     logger = get_logger('vibezen.format.json')
     logger.info("JSON formatted message", extra_field="value", number=42)
     
     # Test Pretty format
     print("\n--- Pretty Format ---")
-    pretty_config = LoggingConfig(
-        level=LogLevel.INFO,
-        format="pretty",
-        console_enabled=True,
-        file_enabled=False
-    )
-    setup_logging(pretty_config)
+    set_format("pretty")
     
     logger = get_logger('vibezen.format.pretty')
     logger.set_context(operation="test", request_id="req-999")
@@ -236,13 +244,7 @@ async def test_log_formats():
     
     # Test Compact format
     print("\n--- Compact Format ---")
-    compact_config = LoggingConfig(
-        level=LogLevel.INFO,
-        format="compact",
-        console_enabled=True,
-        file_enabled=False
-    )
-    setup_logging(compact_config)
+    set_format("compact")
     
     logger = get_logger('vibezen.format.compact')
     logger.info("Compact formatted message", operation="test")
@@ -283,8 +285,10 @@ async def test_async_file_handler():
         if i % 10 == 0:
             logger.warning(f"Warning at index {i}")
     
-    # Give async handler time to flush
-    await asyncio.sleep(2)
+    # Wait for the async handler to write everything buffered so far
+    for handler in logging.getLogger('vibezen').handlers:
+        if isinstance(handler, AsyncFileHandler):
+            await handler.drain()
     
     # Check if file was created
     log_file = Path("test_logs/vibezen_test.log")
@@ -362,4 +366,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()
\ No newline at end of file
+    asyncio.run(main())
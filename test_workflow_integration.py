@@ -3,18 +3,53 @@
 Test script to verify VIBEZEN integration with spec_to_implementation_workflow.py
 """
 
+import argparse
 import asyncio
+import importlib.util
+import shlex
 import sys
-import subprocess
 from pathlib import Path
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent))
-sys.path.insert(0, str(Path(__file__).parent.parent / "memory-integration-project"))
+# Add paths (once, even if this module is imported again)
+_ROOT = Path(__file__).parent
+for _path in (str(_ROOT), str(_ROOT.parent / "memory-integration-project")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 
-async def test_integration():
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workflow-script",
+        type=Path,
+        default=_ROOT.parent / "memory-integration-project" / "src" / "integration" / "spec_to_implementation_workflow.py",
+        help="Path to spec_to_implementation_workflow.py"
+    )
+    parser.add_argument(
+        "--projects-dir",
+        type=Path,
+        default=_ROOT.parent,
+        help="Directory in which the test projects are created"
+    )
+    parser.add_argument(
+        "--run",
+        action="store_true",
+        help="Run the workflow variants in this process instead of only printing the commands"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run variants even if their project directory already exists"
+    )
+    return parser.parse_args(argv)
+
+
+async def test_integration(args=None):
     """Test VIBEZEN integration"""
+    if args is None:
+        args = parse_args([])
+    
     print("=" * 60)
     print("VIBEZEN Integration Test")
     print("=" * 60)
@@ -22,47 +57,79 @@ async def test_integration():
     # Test project details
     test_project = "vibezen_test_project"
     test_description = "Test project for VIBEZEN integration"
-    project_path = f"/mnt/c/Users/tky99/dev/{test_project}"
+    project_path = str(args.projects_dir / test_project)
     
-    # Check if VIBEZEN is importable
+    # Check if VIBEZEN is importable (locate the package before importing it)
     try:
+        if importlib.util.find_spec("vibezen") is None:
+            raise ImportError("No module named 'vibezen'")
         from vibezen.integration.workflow_adapter import create_vibezen_adapter
         print("✅ VIBEZEN import successful")
     except ImportError as e:
         print(f"❌ VIBEZEN import failed: {e}")
         print("\nPlease install VIBEZEN first:")
-        print("  cd /mnt/c/Users/tky99/dev/vibezen")
+        print(f"  cd {_ROOT}")
         print("  pip install -e .")
         return
     
     # Test workflow import
     try:
+        if importlib.util.find_spec("src.integration") is None:
+            raise ImportError("No module named 'src.integration'")
         from src.integration.spec_to_implementation_workflow import SpecToImplementationWorkflow, VIBEZEN_AVAILABLE
         print(f"✅ Workflow import successful (VIBEZEN_AVAILABLE={VIBEZEN_AVAILABLE})")
     except ImportError as e:
         print(f"❌ Workflow import failed: {e}")
         return
     
-    # Test commands
-    commands = [
-        # Without VIBEZEN
-        f"python /mnt/c/Users/tky99/dev/memory-integration-project/src/integration/spec_to_implementation_workflow.py {test_project} --description '{test_description}' --path {project_path} --force",
-        
-        # With VIBEZEN
-        f"python /mnt/c/Users/tky99/dev/memory-integration-project/src/integration/spec_to_implementation_workflow.py {test_project}_vibezen --description '{test_description} with VIBEZEN' --path {project_path}_vibezen --enable-vibezen --force",
-        
-        # With VIBEZEN options
-        f"python /mnt/c/Users/tky99/dev/memory-integration-project/src/integration/spec_to_implementation_workflow.py {test_project}_vibezen_nocache --description '{test_description} with VIBEZEN no cache' --path {project_path}_vibezen_nocache --enable-vibezen --vibezen-no-cache --force"
+    # Workflow variants: (label, project name, description, path, CLI options)
+    variants = [
+        ("Without VIBEZEN", test_project, test_description,
+         project_path, []),
+        ("With VIBEZEN", f"{test_project}_vibezen", f"{test_description} with VIBEZEN",
+         f"{project_path}_vibezen", ["--enable-vibezen"]),
+        ("With VIBEZEN (no cache)", f"{test_project}_vibezen_nocache", f"{test_description} with VIBEZEN no cache",
+         f"{project_path}_vibezen_nocache", ["--enable-vibezen", "--vibezen-no-cache"]),
     ]
     
     print("\n" + "=" * 60)
     print("Test Commands:")
     print("=" * 60)
     
-    for i, cmd in enumerate(commands, 1):
-        print(f"\n{i}. Command:")
-        print(f"   {cmd}")
-        print(f"\n   To run: {cmd}")
+    force = ["--force"] if args.force else []
+    for i, (label, name, description, path, options) in enumerate(variants, 1):
+        cmd = [sys.executable, str(args.workflow_script), name, "--description", description,
+               "--path", path, *options, *force]
+        print(f"\n{i}. Command ({label}):")
+        print(f"   {shlex.join(cmd)}")
+    
+    if args.run:
+        # Same configurations as the CLI options, run concurrently in this process
+        async def run_variant(name, description, path, options):
+            if Path(path).exists() and not args.force:
+                raise FileExistsError(f"{path} already exists (use --force to reuse it)")
+            adapter = create_vibezen_adapter(
+                enable="--enable-vibezen" in options,
+                enable_caching="--vibezen-no-cache" not in options
+            )
+            workflow = SpecToImplementationWorkflow(path, vibezen_adapter=adapter)
+            return await workflow.execute_full_workflow(
+                project_name=name,
+                description=description,
+                auto_implement=True
+            )
+        
+        results = await asyncio.gather(
+            *(run_variant(name, description, path, options)
+              for _, name, description, path, options in variants),
+            return_exceptions=True
+        )
+        
+        for i, ((label, *_), result) in enumerate(zip(variants, results), 1):
+            if isinstance(result, Exception):
+                print(f"❌ {i}. {label}: {result}")
+            else:
+                print(f"✅ {i}. {label}: completed")
     
     print("\n" + "=" * 60)
     print("Direct Integration Test")
@@ -106,11 +173,11 @@ async def test_integration():
     print("Integration Complete!")
     print("=" * 60)
     print("\nNext steps:")
-    print("1. Run one of the test commands above")
+    print("1. Run one of the test commands above (or rerun this script with --run)")
     print("2. Check for VIBEZEN messages in the output")
     print("3. Look for vibezen_metrics.json in the project directory")
     print("4. Compare results with and without --enable-vibezen")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_integration())
\ No newline at end of file
+    asyncio.run(test_integration(parse_args()))
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Static sample data shared by the VIBEZEN tests.
+
+conftest.py exposes these through session-scoped fixtures; tests that
+do not need fixture injection can import them directly.
+"""
+
+import textwrap
+
+
+SAMPLE_SPECIFICATION = {
+    "name": "Calculator",
+    "description": "A simple calculator that can add two numbers",
+    "requirements": [
+        "Function should accept two numbers",
+        "Function should return their sum",
+        "Function should handle invalid inputs gracefully",
+    ],
+    "constraints": [
+        "No external dependencies",
+        "Pure Python implementation",
+    ],
+    "examples": [
+        {"input": [2, 3], "output": 5},
+        {"input": [0, 0], "output": 0},
+        {"input": [-1, 1], "output": 0},
+    ],
+}
+
+SAMPLE_CODE = textwrap.dedent('''\
+    def add_numbers(a, b):
+        """Add two numbers and return the result."""
+        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+            raise TypeError("Both arguments must be numbers")
+        return a + b
+    ''')
+
+SAMPLE_TEST_CODE = textwrap.dedent('''\
+    import pytest
+    from calculator import add_numbers
+
+    def test_add_positive_numbers():
+        assert add_numbers(2, 3) == 5
+
+    def test_add_zero():
+        assert add_numbers(0, 0) == 0
+
+    def test_add_negative_numbers():
+        assert add_numbers(-1, 1) == 0
+
+    def test_invalid_input():
+        with pytest.raises(TypeError):
+            add_numbers("a", 2)
+    ''')
@@ -2,46 +2,54 @@
 Pytest configuration and fixtures for VIBEZEN tests.
 """
 
-import asyncio
+import logging
+import os
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from typing import Generator, AsyncGenerator
-from unittest.mock import Mock, AsyncMock
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock
 
 from vibezen.core.config import VIBEZENConfig
 from vibezen.core.guard_v2 import VIBEZENGuardV2
 from vibezen.providers.base import AIProvider, ProviderCapability
+from vibezen.proxy.ai_proxy import AIResponse
 from vibezen.providers.registry import ProviderRegistry
 from vibezen.cache import CacheManager
 from vibezen.metrics import MetricsCollector, MetricsStorage
-from vibezen.logging import setup_logging
+from vibezen.logging import LoggingConfig, LogLevel, setup_logging
 
+from tests._fixtures_data import SAMPLE_CODE, SAMPLE_SPECIFICATION, SAMPLE_TEST_CODE
 
-# Configure pytest-asyncio
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Configure pytest-asyncio (it provides the event loop fixtures)
 pytest_plugins = ("pytest_asyncio",)
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+if uvloop is not None and os.environ.get("VIBEZEN_TEST_UVLOOP") == "1":
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the session-wide test loop on uvloop (opt-in via VIBEZEN_TEST_UVLOOP=1)."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for tests (cleaned up by pytest)."""
+    return tmp_path
 
 
-@pytest.fixture
-def test_config(temp_dir: Path) -> VIBEZENConfig:
-    """Create a test configuration."""
+@pytest.fixture(scope="module")
+def module_temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary directory shared by the tests of a module."""
+    return tmp_path_factory.mktemp("vibezen", numbered=True)
+
+
+def _make_test_config(temp_dir: Path) -> VIBEZENConfig:
+    """Build a test configuration storing its data under temp_dir."""
     config = VIBEZENConfig()
     
     # Override paths to use temp directory
@@ -60,6 +68,12 @@ def test_config(temp_dir: Path) -> VIBEZENConfig:
     return config
 
 
+@pytest.fixture
+def test_config(temp_dir: Path) -> VIBEZENConfig:
+    """Create a test configuration."""
+    return _make_test_config(temp_dir)
+
+
 @pytest.fixture
 async def mock_provider() -> AIProvider:
     """Create a mock AI provider for testing."""
@@ -103,96 +117,87 @@ async def cache_manager(temp_dir: Path) -> AsyncGenerator[CacheManager, None]:
 @pytest.fixture
 async def metrics_collector(temp_dir: Path) -> AsyncGenerator[MetricsCollector, None]:
     """Create a metrics collector for testing."""
-    storage = MetricsStorage(storage_dir=temp_dir / "metrics")
+    storage = MetricsStorage(temp_dir / "metrics")
     collector = MetricsCollector(storage=storage, buffer_size=10)
     yield collector
     await collector.flush()
 
 
-@pytest.fixture
-async def vibezen_guard(test_config: VIBEZENConfig) -> AsyncGenerator[VIBEZENGuardV2, None]:
-    """Create a VIBEZEN guard instance for testing."""
-    guard = VIBEZENGuardV2(config=test_config)
+@pytest.fixture(scope="module")
+async def _module_guard(module_temp_dir: Path) -> VIBEZENGuardV2:
+    """Initialize one VIBEZEN guard per test module."""
+    guard = VIBEZENGuardV2(config=_make_test_config(module_temp_dir))
     await guard.initialize()
-    yield guard
+    return guard
+
+
+@pytest.fixture
+async def vibezen_guard(_module_guard: VIBEZENGuardV2) -> AsyncGenerator[VIBEZENGuardV2, None]:
+    """Provide the module's VIBEZEN guard, reset after each test."""
+    metrics_collector = _module_guard.metrics_collector
+    yield _module_guard
+    # Undo collector swaps so they don't leak into later tests
+    _module_guard.metrics_collector = metrics_collector
+    await _module_guard.reset_state()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def setup_test_logging():
-    """Set up logging for tests."""
-    setup_logging(level="DEBUG")
+    """Set up logging once for the whole test session."""
+    setup_logging(LoggingConfig(
+        level=LogLevel.DEBUG,
+        format="compact",
+        file_enabled=False,
+        metrics_enabled=False
+    ))
+    yield
+    
+    vibezen_logger = logging.getLogger("vibezen")
+    for handler in vibezen_logger.handlers[:]:
+        vibezen_logger.removeHandler(handler)
+        handler.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_factory():
-    """Factory for creating mock AI responses."""
+    """
+    Factory for creating mock AI responses.
+    
+    Builds plain AIResponse instances rather than Mock objects; the guard
+    only reads content and thinking_trace, and dataclass construction
+    avoids Mock's per-instance setup.
+    """
     def _create_response(
         content: str = "Mock response",
         thinking_trace: list = None,
         metadata: dict = None,
-    ):
-        return Mock(
+    ) -> AIResponse:
+        return AIResponse(
             content=content,
-            thinking_trace=thinking_trace or ["Step 1", "Step 2"],
+            provider="mock",
+            model="mock-model",
             metadata=metadata or {},
-            usage={"prompt_tokens": 10, "completion_tokens": 20},
+            thinking_trace=thinking_trace or ["Step 1", "Step 2"],
         )
     return _create_response
 
 
-@pytest.fixture
-def sample_specification():
-    """Sample specification for testing."""
-    return {
-        "name": "Calculator",
-        "description": "A simple calculator that can add two numbers",
-        "requirements": [
-            "Function should accept two numbers",
-            "Function should return their sum",
-            "Function should handle invalid inputs gracefully",
-        ],
-        "constraints": [
-            "No external dependencies",
-            "Pure Python implementation",
-        ],
-        "examples": [
-            {"input": [2, 3], "output": 5},
-            {"input": [0, 0], "output": 0},
-            {"input": [-1, 1], "output": 0},
-        ],
-    }
+@pytest.fixture(scope="session")
+def sample_specification() -> dict:
+    """Sample specification for testing (shared, do not mutate)."""
+    return SAMPLE_SPECIFICATION
 
 
-@pytest.fixture
-def sample_code():
+@pytest.fixture(scope="session")
+def sample_code() -> str:
     """Sample code implementation for testing."""
-    return '''def add_numbers(a, b):
-    """Add two numbers and return the result."""
-    if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-        raise TypeError("Both arguments must be numbers")
-    return a + b
-'''
+    return SAMPLE_CODE
 
 
-@pytest.fixture
-def sample_test_code():
+@pytest.fixture(scope="session")
+def sample_test_code() -> str:
     """Sample test code for testing."""
-    return '''import pytest
-from calculator import add_numbers
-
-def test_add_positive_numbers():
-    assert add_numbers(2, 3) == 5
-
-def test_add_zero():
-    assert add_numbers(0, 0) == 0
-
-def test_add_negative_numbers():
-    assert add_numbers(-1, 1) == 0
-
-def test_invalid_input():
-    with pytest.raises(TypeError):
-        add_numbers("a", 2)
-'''
+    return SAMPLE_TEST_CODE
 
 
 # Markers for test categorization
@@ -0,0 +1,36 @@
+"""
+Pytest fixtures for VIBEZEN integration tests.
+"""
+
+import pytest
+from typing import AsyncGenerator
+
+from vibezen.core.guard_v2 import VIBEZENGuardV2
+from vibezen.prompts.template_engine import PromptTemplateEngine
+
+
+@pytest.fixture(scope="session")
+def template_engine() -> PromptTemplateEngine:
+    """One template engine per session, so identical prompts render once."""
+    return PromptTemplateEngine()
+
+
+@pytest.fixture(scope="module")
+async def shared_guard(
+    template_engine: PromptTemplateEngine,
+) -> AsyncGenerator[VIBEZENGuardV2, None]:
+    """Initialize one guard per module and close its providers afterwards."""
+    guard = VIBEZENGuardV2()
+    # Share rendered prompts (e.g. the TEST_SPEC understanding prompt) across modules
+    guard.template_engine = template_engine
+    guard.ai_proxy.template_engine = template_engine
+    await guard.initialize()
+    yield guard
+    await guard.close()
+
+
+@pytest.fixture
+async def guard(shared_guard: VIBEZENGuardV2) -> AsyncGenerator[VIBEZENGuardV2, None]:
+    """Provide the module's shared guard, reset after each test."""
+    yield shared_guard
+    await shared_guard.reset_state()
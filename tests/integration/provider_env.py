@@ -0,0 +1,42 @@
+"""
+Shared settings for the real AI provider integration tests.
+
+Set USE_MOCK_PROVIDER=true to replay recorded responses instead of
+calling the APIs (see vibezen.providers.recording). Recordings live in
+tests/fixtures/llm_mocks/<provider> unless VIBEZEN_LLM_MOCK_DIR says
+otherwise; record them with UPDATE_MOCK_CACHE=true and an API key.
+"""
+
+import os
+from pathlib import Path
+
+from vibezen.providers.recording import replay_available
+
+
+os.environ.setdefault(
+    "VIBEZEN_LLM_MOCK_DIR",
+    str(Path(__file__).resolve().parent.parent / "fixtures" / "llm_mocks"),
+)
+
+# Skip tests if no API keys are available. With USE_MOCK_PROVIDER set,
+# recorded responses stand in for the OpenAI and Google APIs, but only
+# for providers that have recordings.
+OPENAI_AVAILABLE = bool(os.getenv("OPENAI_API_KEY")) or replay_available("openai")
+ANTHROPIC_AVAILABLE = bool(os.getenv("ANTHROPIC_API_KEY"))
+GOOGLE_AVAILABLE = bool(os.getenv("GOOGLE_API_KEY")) or replay_available("google")
+
+# Simple specification for testing
+TEST_SPEC = {
+    "name": "Calculator Service",
+    "description": "A simple calculator that performs basic arithmetic",
+    "features": [
+        "Addition of two numbers",
+        "Subtraction of two numbers",
+        "Input validation"
+    ],
+    "requirements": [
+        "All operations should handle decimal numbers",
+        "Error messages should be user-friendly",
+        "No hardcoded values"
+    ]
+}
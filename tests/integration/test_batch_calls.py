@@ -0,0 +1,66 @@
+"""
+Integration tests for batched AI calls.
+
+The OpenAI test requires OPENAI_API_KEY, or USE_MOCK_PROVIDER=true to
+replay recorded responses.
+"""
+
+import pytest
+
+from vibezen.proxy.ai_proxy import AIProxy, ProxyConfig
+from provider_env import OPENAI_AVAILABLE
+
+# One prompt per specification feature
+TEST_PROMPTS = [
+    f"Classify this calculator requirement as functional or non-functional: {feature}"
+    for feature in (
+        "Addition of two numbers",
+        "Subtraction of two numbers",
+        "Multiplication of two numbers",
+        "Division of two numbers",
+        "Input validation",
+        "Handle decimal numbers",
+        "User-friendly error messages",
+        "No hardcoded values",
+        "Respond within 100 ms",
+        "Log every operation",
+    )
+]
+
+
+@pytest.mark.integration
+class TestBatchCalls:
+    """Test batched AI calls through the proxy."""
+    
+    async def test_mock_batch_caches_each_prompt(self):
+        """Test that each prompt of a batch is cached on its own."""
+        proxy = AIProxy(ProxyConfig(cache_prompts=True))
+        
+        responses = await proxy.call_many(
+            TEST_PROMPTS[:3],
+            provider="mock",
+            model="test-model"
+        )
+        
+        assert len(responses) == 3
+        assert [r.metadata["batch_index"] for r in responses] == [0, 1, 2]
+        assert all(r.metadata["batched"] is True for r in responses)
+        
+        # A later single call with one of the prompts is served from cache
+        single = await proxy.call(TEST_PROMPTS[1], provider="mock", model="test-model")
+        assert single.metadata.get("from_cache") is True
+        assert single.content == responses[1].content
+    
+    @pytest.mark.skipif(not OPENAI_AVAILABLE, reason="No OpenAI API key or recorded responses")
+    async def test_openai_batch(self, guard):
+        """Test sending ten prompts to OpenAI as one batch."""
+        responses = await guard.ai_proxy.call_many(
+            TEST_PROMPTS,
+            provider="openai",
+            model="gpt-3.5-turbo",
+            temperature=0
+        )
+        
+        assert len(responses) == 10
+        assert all(r.content for r in responses)
+        assert all(r.metadata["batched"] is True for r in responses)
@@ -16,18 +16,6 @@ from vibezen.core.models import ThinkingPhase, ThinkingContext
 class TestPromptIntervention:
     """Test the prompt intervention system."""
     
-    @pytest.fixture
-    async def guard(self):
-        """Create a guard instance."""
-        guard = VIBEZENGuardV2()
-        await guard.initialize()
-        return guard
-    
-    @pytest.fixture
-    def template_engine(self):
-        """Create template engine."""
-        return PromptTemplateEngine()
-    
     async def test_thinking_prompt_generation(self, template_engine):
         """Test that thinking prompts are generated correctly."""
         # Generate a spec understanding prompt
@@ -42,6 +30,40 @@ class TestPromptIntervention:
         assert "think step-by-step" in prompt.lower()
         assert "5 steps" in prompt
         assert "specification" in prompt.lower()
+        
+        # The same input is served from the prompt cache without re-rendering
+        render_count = template_engine._render_count
+        cached = await template_engine.generate_prompt(
+            phase=ThinkingPhase.SPEC_UNDERSTANDING,
+            context={
+                "specification": "Build a user authentication system",
+                "min_steps": 5,
+            }
+        )
+        assert cached == prompt
+        assert template_engine._render_count == render_count
+    
+    async def test_prompt_cache_is_bounded(self):
+        """Test that the prompt cache evicts the least recently used prompts."""
+        engine = PromptTemplateEngine(prompt_cache_size=2)
+        
+        async def render(specification):
+            return await engine.generate_prompt(
+                phase=ThinkingPhase.SPEC_UNDERSTANDING,
+                context={"specification": specification, "min_steps": 5},
+            )
+        
+        await render("spec A")
+        await render("spec B")
+        await render("spec A")  # A is now the most recently used
+        await render("spec C")  # Evicts B
+        assert len(engine._prompt_cache) == 2
+        
+        render_count = engine._render_count
+        await render("spec A")
+        assert engine._render_count == render_count
+        await render("spec B")
+        assert engine._render_count == render_count + 1
     
     async def test_hardcode_detection_template(self):
         """Test hardcode detection template."""
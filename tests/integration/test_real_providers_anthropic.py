@@ -0,0 +1,41 @@
+"""
+Integration tests for the Anthropic provider.
+
+These tests require ANTHROPIC_API_KEY to be set.
+"""
+
+import pytest
+
+from provider_env import ANTHROPIC_AVAILABLE, TEST_SPEC
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ANTHROPIC_AVAILABLE, reason="Anthropic API key not available")
+class TestAnthropicProvider:
+    """Test Anthropic provider integration."""
+    
+    async def test_anthropic_basic_call(self, guard):
+        """Test basic Anthropic API call."""
+        response = await guard.ai_proxy.call(
+            prompt="Explain quantum computing in one sentence",
+            provider="anthropic",
+            model="claude-3-haiku",
+            temperature=0.5
+        )
+        
+        assert response.content
+        assert response.provider == "anthropic"
+        assert response.model == "claude-3-haiku"
+    
+    async def test_anthropic_thinking_trace(self, guard):
+        """Test thinking trace extraction with Claude."""
+        # Claude is good at structured thinking
+        result = await guard.guide_specification_understanding(
+            specification=TEST_SPEC,
+            provider="anthropic",
+            model="claude-3-sonnet"
+        )
+        
+        assert result["success"]
+        assert result["thinking_trace"] is not None
+        assert result["understanding"]["confidence"] > 0.5
@@ -0,0 +1,50 @@
+"""
+Integration tests for the Google provider.
+
+These tests require GOOGLE_API_KEY to be set, or USE_MOCK_PROVIDER=true
+to replay recorded responses (see vibezen.providers.recording).
+"""
+
+import pytest
+
+from provider_env import GOOGLE_AVAILABLE, TEST_SPEC
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not GOOGLE_AVAILABLE, reason="No Google API key or recorded responses")
+class TestGoogleProvider:
+    """Test Google provider integration."""
+    
+    async def test_google_basic_call(self, guard):
+        """Test basic Google AI API call."""
+        response = await guard.ai_proxy.call(
+            prompt="What is machine learning?",
+            provider="google",
+            model="gemini-pro",
+            temperature=0.3
+        )
+        
+        assert response.content
+        assert response.provider == "google"
+        assert response.model == "gemini-pro"
+    
+    async def test_google_multi_turn(self, guard):
+        """Test multi-turn conversation with Gemini."""
+        # Start a conversation
+        result1 = await guard.guide_specification_understanding(
+            specification=TEST_SPEC,
+            provider="google",
+            model="gemini-pro"
+        )
+        
+        # Continue with implementation
+        result2 = await guard.guide_implementation_choice(
+            specification=TEST_SPEC,
+            understanding=result1["understanding"],
+            provider="google",
+            model="gemini-pro"
+        )
+        
+        assert result1["success"]
+        assert result2["success"]
+        assert len(result2["approaches"]) > 0
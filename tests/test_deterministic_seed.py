@@ -175,13 +175,12 @@ class TestDeterministicIntegration:
         
         context = {"code": "async def main(): pass"}
         
+        async def get_seed():
+            # get_seed is cheap and synchronous; no thread pool needed
+            return manager.get_seed("challenge", context)
+        
         # Run multiple async tasks
-        tasks = [
-            asyncio.create_task(
-                asyncio.to_thread(manager.get_seed, "challenge", context)
-            )
-            for _ in range(5)
-        ]
+        tasks = [asyncio.create_task(get_seed()) for _ in range(5)]
         
         seeds = await asyncio.gather(*tasks)
         
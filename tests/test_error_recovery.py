@@ -53,15 +53,55 @@ class TimeoutProvider(AIProvider):
         return True
 
 
-@pytest.mark.asyncio
-async def test_retry_on_failure():
+class InstantProvider(AIProvider):
+    """Provider that answers at once, naming itself in the response."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = []
+    
+    async def call(self, request: AIRequest) -> AIResponse:
+        """Answer immediately."""
+        self.requests.append(request)
+        return AIResponse(
+            content=f"Answer from {self.name}",
+            provider=self.name,
+            model=request.model
+        )
+    
+    def is_available(self) -> bool:
+        return True
+
+
+class FakeClock:
+    """Manually advanced monotonic clock for circuit breaker timeouts."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def proxy_factory():
+    """Return a factory for AIProxy instances built from ProxyConfig options."""
+    def make(**config_kwargs) -> AIProxy:
+        return AIProxy(ProxyConfig(**config_kwargs))
+    
+    return make
+
+
+async def test_retry_on_failure(proxy_factory):
     """Test retry mechanism on transient failures."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         max_retries=3,
         retry_initial_delay=0.1,
         timeout_seconds=10
     )
-    proxy = AIProxy(config)
     
     # Register provider that fails twice then succeeds
     failing_provider = FailingProvider(fail_count=2)
@@ -82,15 +122,13 @@ async def test_retry_on_failure():
     assert stats["retry_stats"]["failing"]["retry_count"] == 0  # Reset after success
 
 
-@pytest.mark.asyncio
-async def test_retry_exhaustion():
+async def test_retry_exhaustion(proxy_factory):
     """Test when all retries are exhausted."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         max_retries=2,
         retry_initial_delay=0.1,
         enable_fallback=False  # Disable fallback to test retry exhaustion
     )
-    proxy = AIProxy(config)
     
     # Register provider that always fails
     failing_provider = FailingProvider(fail_count=10)
@@ -112,16 +150,14 @@ async def test_retry_exhaustion():
     assert stats["retry_stats"]["failing"]["retry_count"] == 3
 
 
-@pytest.mark.asyncio
-async def test_timeout_retry():
+async def test_timeout_retry(proxy_factory):
     """Test retry on timeout."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         max_retries=2,
         retry_initial_delay=0.1,
         timeout_seconds=0.5,
         enable_fallback=False  # Disable fallback to test timeout behavior
     )
-    proxy = AIProxy(config)
     
     # Register provider that times out
     timeout_provider = TimeoutProvider(timeout_duration=1.0)
@@ -136,17 +172,15 @@ async def test_timeout_retry():
         )
 
 
-@pytest.mark.asyncio
-async def test_circuit_breaker_opens():
+async def test_circuit_breaker_opens(proxy_factory):
     """Test circuit breaker opening after failures."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         enable_circuit_breaker=True,
         circuit_breaker_failure_threshold=3,
         circuit_breaker_timeout_seconds=1,
         max_retries=0,  # No retries to test circuit breaker
         enable_fallback=False  # Disable fallback to test circuit breaker
     )
-    proxy = AIProxy(config)
     
     # Register provider that always fails
     failing_provider = FailingProvider(fail_count=10)
@@ -175,21 +209,21 @@ async def test_circuit_breaker_opens():
     assert stats["circuit_breaker_states"]["failing"]["failure_count"] == 3
 
 
-@pytest.mark.asyncio
-async def test_circuit_breaker_recovery():
+async def test_circuit_breaker_recovery(proxy_factory):
     """Test circuit breaker recovery."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         enable_circuit_breaker=True,
         circuit_breaker_failure_threshold=2,
         circuit_breaker_timeout_seconds=1,
         max_retries=0,
         enable_fallback=False  # Disable fallback to test circuit breaker recovery
     )
-    proxy = AIProxy(config)
     
     # Register provider that fails then recovers
     failing_provider = FailingProvider(fail_count=2)
     proxy.register_provider("failing", failing_provider)
+    clock = FakeClock()
+    proxy.circuit_breakers["failing"].clock = clock
     
     # Open circuit
     for i in range(2):
@@ -208,8 +242,8 @@ async def test_circuit_breaker_recovery():
             model="test-model"
         )
     
-    # Wait for timeout
-    await asyncio.sleep(1.1)
+    # Let the open timeout pass
+    clock.advance(1.1)
     
     # Should succeed now (provider recovered)
     # Need to make success_threshold (2) successful calls to close circuit
@@ -233,15 +267,13 @@ async def test_circuit_breaker_recovery():
     assert stats["circuit_breaker_states"]["failing"]["state"] == "closed"
 
 
-@pytest.mark.asyncio
-async def test_fallback_to_cache():
+async def test_fallback_to_cache(proxy_factory):
     """Test fallback to cached value."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         enable_fallback=True,
         cache_prompts=True,
         max_retries=0
     )
-    proxy = AIProxy(config)
     
     # First, make a successful call to populate cache
     proxy.register_provider("mock", proxy.providers["mock"])  # Use built-in mock
@@ -268,15 +300,13 @@ async def test_fallback_to_cache():
     assert response2.content == response1.content
 
 
-@pytest.mark.asyncio
-async def test_fallback_to_alternative_provider():
+async def test_fallback_to_alternative_provider(proxy_factory):
     """Test fallback to alternative provider."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         enable_fallback=True,
         cache_prompts=False,  # Disable cache to test provider fallback
         max_retries=0
     )
-    proxy = AIProxy(config)
     
     # Register multiple providers
     failing_provider = FailingProvider(fail_count=10)
@@ -299,16 +329,14 @@ async def test_fallback_to_alternative_provider():
     # Could also check for fallback metadata if it was added
 
 
-@pytest.mark.asyncio
-async def test_manual_circuit_reset():
+async def test_manual_circuit_reset(proxy_factory):
     """Test manual circuit breaker reset."""
-    config = ProxyConfig(
+    proxy = proxy_factory(
         enable_circuit_breaker=True,
         circuit_breaker_failure_threshold=2,
         max_retries=0,
         enable_fallback=False  # Disable fallback to test circuit reset
     )
-    proxy = AIProxy(config)
     
     # Register provider that fails initially
     failing_provider = FailingProvider(fail_count=5)
@@ -344,4 +372,127 @@ async def test_manual_circuit_reset():
     
     # Circuit state should show it's working again
     stats = proxy.get_error_recovery_stats()
-    assert stats["circuit_breaker_states"]["failing"]["failure_count"] == 1
\ No newline at end of file
+    assert stats["circuit_breaker_states"]["failing"]["failure_count"] == 1
+
+@pytest.mark.parametrize("rate_limits, min_elapsed, max_elapsed", [
+    ({"instant": (1, 0.1)}, 0.15, 1.0),  # 1 request per 100ms
+    ({}, 0.0, 0.1),
+], ids=["limited", "unlimited"])
+async def test_rate_limit_throttles_provider_calls(
+    proxy_factory, rate_limits, min_elapsed, max_elapsed
+):
+    """Test that provider calls wait for the provider's rate limit."""
+    proxy = proxy_factory(
+        cache_prompts=False,
+        enable_semantic_cache=False,
+        rate_limits=rate_limits
+    )
+    proxy.register_provider("instant", InstantProvider("instant"))
+    
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(3):
+        await proxy.call(
+            prompt=f"Test prompt {i}",
+            provider="instant",
+            model="test-model"
+        )
+    
+    # With a limit the first call uses the full bucket and the next two
+    # wait for refills; the provider itself answers at once
+    assert min_elapsed <= loop.time() - start < max_elapsed
+
+
+async def test_session_sets_call_defaults(proxy_factory):
+    """Test that a proxy session supplies the provider and model."""
+    proxy = proxy_factory(max_retries=0, enable_fallback=False)
+    failing_provider = FailingProvider(fail_count=0)
+    proxy.register_provider("failing", failing_provider)
+    
+    async with proxy.session(provider="failing", model="test-model"):
+        response = await proxy.call(prompt="Test prompt")
+        
+        # Other proxies keep their own defaults
+        other = await proxy_factory().call(prompt="Test prompt")
+    
+    assert response.provider == "failing"
+    assert response.model == "test-model"
+    assert failing_provider.call_count == 1
+    assert other.provider == "mock"
+    
+    # Defaults are restored outside the session
+    response = await proxy.call(prompt="Another prompt")
+    assert response.provider == "mock"
+
+
+async def test_speculative_backup_wins_over_slow_primary(proxy_factory):
+    """Test that the configured backup answers for a slow primary."""
+    proxy = proxy_factory(
+        speculative=True,
+        speculative_delay_seconds=0.05,
+        speculative_backup=("backup", "backup-model"),
+        cache_prompts=False,
+        enable_semantic_cache=False
+    )
+    proxy.register_provider("timeout", TimeoutProvider(timeout_duration=5.0))
+    backup_provider = InstantProvider("backup")
+    proxy.register_provider("backup", backup_provider)
+    
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    response = await proxy.call(
+        prompt="Test prompt",
+        provider="timeout",
+        model="test-model"
+    )
+    
+    # The backup answers long before the primary would, with its own model
+    assert response.provider == "backup"
+    assert response.metadata["speculative"] is True
+    assert backup_provider.requests[0].model == "backup-model"
+    assert loop.time() - start < 1.0
+
+
+async def test_speculative_backup_starts_when_primary_fails(proxy_factory):
+    """Test that a failing primary starts the backup at once."""
+    proxy = proxy_factory(
+        speculative=True,
+        speculative_delay_seconds=5.0,
+        speculative_backup=("backup", "backup-model"),
+        max_retries=0,
+        enable_fallback=False,
+        cache_prompts=False,
+        enable_semantic_cache=False
+    )
+    failing_provider = FailingProvider(fail_count=10)
+    proxy.register_provider("failing", failing_provider)
+    proxy.register_provider("backup", InstantProvider("backup"))
+    
+    response = await proxy.call(
+        prompt="Test prompt",
+        provider="failing",
+        model="test-model"
+    )
+    
+    assert response.provider == "backup"
+    assert failing_provider.call_count == 1
+
+
+async def test_speculative_without_backup_waits_for_primary(proxy_factory):
+    """Test that speculation never substitutes an unconfigured provider."""
+    proxy = proxy_factory(
+        speculative=True,
+        speculative_delay_seconds=0.01,
+        cache_prompts=False,
+        enable_semantic_cache=False
+    )
+    proxy.register_provider("slow", TimeoutProvider(timeout_duration=0.05))
+    
+    response = await proxy.call(
+        prompt="Test prompt",
+        provider="slow",
+        model="test-model"
+    )
+    
+    assert response.provider == "timeout"
+    assert "speculative" not in response.metadata
@@ -5,12 +5,36 @@ Tests all phases of the VIBEcoding workflow with various scenarios.
 """
 
 import pytest
+from contextlib import ExitStack
 from unittest.mock import Mock, AsyncMock, patch
 
 from vibezen.core.guard_v2 import VIBEZENGuardV2
 from vibezen.core.models import ThinkingPhase, SpecViolation, ViolationType, Severity
 from vibezen.proxy.ai_proxy import AIResponse
 
+from tests._fixtures_data import SAMPLE_CODE, SAMPLE_TEST_CODE
+
+
+def _wrap_python(code: str) -> str:
+    """Wrap code in a Python markdown block, as an AI response would."""
+    return f"```python\n{code}\n```"
+
+
+def _async_return(value):
+    """Build an async stand-in that always returns value (no AsyncMock)."""
+    async def _return(*args, **kwargs):
+        return value
+    return _return
+
+
+def _async_sequence(values):
+    """Build an async stand-in that returns values one call at a time."""
+    remaining = iter(values)
+    
+    async def _next(*args, **kwargs):
+        return next(remaining)
+    return _next
+
 
 @pytest.mark.unit
 class TestGuardV2Initialization:
@@ -66,10 +90,12 @@ class TestSpecificationUnderstanding:
             ],
         )
         
+        metrics_before = vibezen_guard.metrics_collector.count()
+        
         with patch.object(
             vibezen_guard.ai_proxy,
             'force_thinking',
-            return_value=mock_response
+            new=_async_return(mock_response)
         ):
             result = await vibezen_guard.guide_specification_understanding(
                 sample_specification,
@@ -83,7 +109,7 @@ class TestSpecificationUnderstanding:
         assert result["next_phase"] == ThinkingPhase.IMPLEMENTATION_CHOICE
         
         # Check metrics were recorded
-        assert vibezen_guard.metrics_collector._buffer
+        assert vibezen_guard.metrics_collector.count() > metrics_before
     
     async def test_spec_understanding_with_low_confidence(
         self,
@@ -158,7 +184,7 @@ class TestImplementationChoice:
             """,
         )
         
-        with patch.object(vibezen_guard.ai_proxy, 'call', return_value=mock_response):
+        with patch.object(vibezen_guard.ai_proxy, 'call', new=_async_return(mock_response)):
             result = await vibezen_guard.guide_implementation_choice(
                 sample_specification,
                 understanding,
@@ -194,6 +220,36 @@ class TestImplementationChoice:
             assert call_args.kwargs["context"] == vibezen_guard.current_context
 
 
+# Code with hardcoded values, and its corrected version
+_HARDCODED_CODE = """
+def add_numbers(a, b):
+    port = 8080  # Hardcoded!
+    return a + b
+"""
+
+_CORRECTED_CODE = """
+def add_numbers(a, b):
+    return a + b
+"""
+
+
+@pytest.fixture(scope="module")
+def violation_responses(mock_response_factory):
+    """AI responses for an implementation with violations, then its correction."""
+    return (
+        mock_response_factory(content=_wrap_python(_HARDCODED_CODE)),
+        mock_response_factory(content=_wrap_python(_CORRECTED_CODE)),
+    )
+
+
+@pytest.fixture
+def checkpoint_result(request, vibezen_guard):
+    """Patch checkpoint validation to pass (or to request.param when indirect)."""
+    result = getattr(request, "param", True)
+    with patch.object(vibezen_guard, '_validate_checkpoint', return_value=result):
+        yield result
+
+
 @pytest.mark.unit
 class TestImplementation:
     """Test implementation phase."""
@@ -204,6 +260,7 @@ class TestImplementation:
         sample_specification,
         sample_code,
         mock_response_factory,
+        checkpoint_result,
     ):
         """Test successful code implementation."""
         approach = {
@@ -212,15 +269,14 @@ class TestImplementation:
         }
         
         mock_response = mock_response_factory(
-            content=f"```python\n{sample_code}\n```",
+            content=_wrap_python(sample_code),
         )
         
-        with patch.object(vibezen_guard.ai_proxy, 'call', return_value=mock_response):
-            with patch.object(vibezen_guard, '_validate_checkpoint', return_value=True):
-                result = await vibezen_guard.guide_implementation(
-                    sample_specification,
-                    approach,
-                )
+        with patch.object(vibezen_guard.ai_proxy, 'call', new=_async_return(mock_response)):
+            result = await vibezen_guard.guide_implementation(
+                sample_specification,
+                approach,
+            )
         
         assert result["success"] is True
         assert result["code"] == sample_code
@@ -231,59 +287,40 @@ class TestImplementation:
         self,
         vibezen_guard,
         sample_specification,
-        mock_response_factory,
+        violation_responses,
+        checkpoint_result,
     ):
         """Test implementation with spec violations."""
         approach = {"name": "Test approach"}
         
-        # Code with hardcoded values
-        bad_code = """
-def add_numbers(a, b):
-    port = 8080  # Hardcoded!
-    return a + b
-"""
-        
-        mock_response = mock_response_factory(
-            content=f"```python\n{bad_code}\n```",
-        )
-        
-        # Mock corrected response
-        corrected_code = """
-def add_numbers(a, b):
-    return a + b
-"""
-        corrected_response = mock_response_factory(
-            content=f"```python\n{corrected_code}\n```",
-        )
-        
         with patch.object(
             vibezen_guard.ai_proxy,
             'call',
-            side_effect=[mock_response, corrected_response]
+            new=_async_sequence(violation_responses)
         ):
-            with patch.object(vibezen_guard, '_validate_checkpoint', return_value=True):
-                result = await vibezen_guard.guide_implementation(
-                    sample_specification,
-                    approach,
-                )
+            result = await vibezen_guard.guide_implementation(
+                sample_specification,
+                approach,
+            )
         
         assert result["success"] is True
-        assert result["code"] == corrected_code.strip()
+        assert result["code"] == _CORRECTED_CODE.strip()
         assert len(result["violations"]) == 0
     
+    @pytest.mark.parametrize("checkpoint_result", [False], indirect=True)
     async def test_checkpoint_validation_failure(
         self,
         vibezen_guard,
         sample_specification,
+        checkpoint_result,
     ):
         """Test checkpoint validation failure."""
         approach = {"name": "Test approach"}
         
-        with patch.object(vibezen_guard, '_validate_checkpoint', return_value=False):
-            result = await vibezen_guard.guide_implementation(
-                sample_specification,
-                approach,
-            )
+        result = await vibezen_guard.guide_implementation(
+            sample_specification,
+            approach,
+        )
         
         assert result["success"] is False
         assert result["error"] == "Checkpoint validation failed"
@@ -304,10 +341,10 @@ class TestTestDesign:
     ):
         """Test generation of comprehensive test suite."""
         mock_response = mock_response_factory(
-            content=f"```python\n{sample_test_code}\n```",
+            content=_wrap_python(sample_test_code),
         )
         
-        with patch.object(vibezen_guard.ai_proxy, 'call', return_value=mock_response):
+        with patch.object(vibezen_guard.ai_proxy, 'call', new=_async_return(mock_response)):
             result = await vibezen_guard.guide_test_design(
                 sample_specification,
                 sample_code,
@@ -319,24 +356,23 @@ class TestTestDesign:
         assert result["coverage_estimate"] > 0
         assert result["next_phase"] == ThinkingPhase.QUALITY_REVIEW
     
+    @pytest.mark.parametrize("test_count, low, high", [
+        (0, 0.0, 0.0),
+        (2, 0.1, 0.9),
+        (10, 1.0, 1.0),
+    ], ids=["no-tests", "partial", "full"])
     async def test_test_coverage_estimation(
         self,
         vibezen_guard,
         sample_specification,
+        test_count,
+        low,
+        high,
     ):
-        """Test coverage estimation logic."""
-        # Test with various test counts
-        tests = []
-        coverage = vibezen_guard._estimate_coverage(tests, sample_specification)
-        assert coverage == 0.0
-        
-        tests = [{"name": "test1"}, {"name": "test2"}]
+        """Test coverage estimation logic for various test counts."""
+        tests = [{"name": f"test{i + 1}"} for i in range(test_count)]
         coverage = vibezen_guard._estimate_coverage(tests, sample_specification)
-        assert 0 < coverage < 1.0
-        
-        tests = [{"name": f"test{i}"} for i in range(10)]
-        coverage = vibezen_guard._estimate_coverage(tests, sample_specification)
-        assert coverage == 1.0
+        assert low <= coverage <= high
 
 
 @pytest.mark.unit
@@ -358,7 +394,7 @@ class TestQualityReview:
             content="Code quality is excellent. No major issues found.",
         )
         
-        with patch.object(vibezen_guard.ai_proxy, 'call', return_value=mock_response):
+        with patch.object(vibezen_guard.ai_proxy, 'call', new=_async_return(mock_response)):
             with patch.object(
                 vibezen_guard,
                 '_extract_review_findings',
@@ -393,7 +429,7 @@ class TestQualityReview:
             content="Several issues found in the code.",
         )
         
-        with patch.object(vibezen_guard.ai_proxy, 'call', return_value=mock_response):
+        with patch.object(vibezen_guard.ai_proxy, 'call', new=_async_return(mock_response)):
             with patch.object(
                 vibezen_guard,
                 '_extract_review_findings',
@@ -411,96 +447,108 @@ class TestQualityReview:
         assert len(result["recommendations"]) > 0
 
 
-@pytest.mark.integration
-class TestEndToEndWorkflow:
-    """Test complete VIBEcoding workflow."""
-    
-    async def test_complete_workflow_success(
-        self,
-        vibezen_guard,
-        sample_specification,
-        sample_code,
-        sample_test_code,
-        mock_response_factory,
-    ):
-        """Test successful completion of entire workflow."""
-        # Mock responses for each phase
-        spec_response = mock_response_factory(
+@pytest.fixture(scope="module")
+def workflow_mock_responses(mock_response_factory):
+    """AI responses for each phase of the end-to-end workflow."""
+    return {
+        "spec": mock_response_factory(
             content="Understanding specification...",
             thinking_trace=["Step 1", "Step 2", "Step 3", "Step 4", "Step 5"],
-        )
-        
-        approach_response = mock_response_factory(
+        ),
+        "approach": mock_response_factory(
             content="Approach 1: Simple implementation",
-        )
-        
-        impl_response = mock_response_factory(
-            content=f"```python\n{sample_code}\n```",
-        )
-        
-        test_response = mock_response_factory(
-            content=f"```python\n{sample_test_code}\n```",
-        )
-        
-        review_response = mock_response_factory(
+        ),
+        "implementation": mock_response_factory(
+            content=_wrap_python(SAMPLE_CODE),
+        ),
+        "tests": mock_response_factory(
+            content=_wrap_python(SAMPLE_TEST_CODE),
+        ),
+        "review": mock_response_factory(
             content="Code quality is good.",
-        )
-        
-        with patch.object(
-            vibezen_guard.ai_proxy,
+        ),
+    }
+
+
+_WORKFLOW_PHASES = (
+    "specification_understanding",
+    "implementation_choice",
+    "implementation",
+    "test_design",
+    "quality_review",
+)
+
+
+@pytest.fixture(scope="module")
+async def workflow_results(_module_guard, sample_specification, workflow_mock_responses):
+    """
+    Run the whole workflow once per module and collect each phase's result.
+    
+    Phases run in order, each on the previous results, and stop at the
+    first unsuccessful phase, so later phases are missing from the result.
+    """
+    guard = _module_guard
+    spec = sample_specification
+    phases = {
+        "specification_understanding": lambda r: guard.guide_specification_understanding(spec),
+        "implementation_choice": lambda r: guard.guide_implementation_choice(
+            spec, r["specification_understanding"]["understanding"]
+        ),
+        "implementation": lambda r: guard.guide_implementation(
+            spec, r["implementation_choice"]["selected_approach"]
+        ),
+        "test_design": lambda r: guard.guide_test_design(spec, r["implementation"]["code"]),
+        "quality_review": lambda r: guard.perform_quality_review(
+            r["implementation"]["code"], r["test_design"]["tests"], spec
+        ),
+    }
+    
+    results = {}
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(
+            guard.ai_proxy,
             'force_thinking',
-            return_value=spec_response
-        ):
-            with patch.object(
-                vibezen_guard.ai_proxy,
-                'call',
-                side_effect=[approach_response, impl_response, test_response, review_response]
-            ):
-                with patch.object(vibezen_guard, '_validate_checkpoint', return_value=True):
-                    # Phase 1: Specification Understanding
-                    result1 = await vibezen_guard.guide_specification_understanding(
-                        sample_specification
-                    )
-                    assert result1["success"] is True
-                    
-                    # Phase 2: Implementation Choice
-                    result2 = await vibezen_guard.guide_implementation_choice(
-                        sample_specification,
-                        result1["understanding"],
-                    )
-                    assert result2["success"] is True
-                    
-                    # Phase 3: Implementation
-                    result3 = await vibezen_guard.guide_implementation(
-                        sample_specification,
-                        result2["selected_approach"],
-                    )
-                    assert result3["success"] is True
-                    
-                    # Phase 4: Test Design
-                    result4 = await vibezen_guard.guide_test_design(
-                        sample_specification,
-                        result3["code"],
-                    )
-                    assert result4["success"] is True
-                    
-                    # Phase 5: Quality Review
-                    result5 = await vibezen_guard.perform_quality_review(
-                        result3["code"],
-                        result4["tests"],
-                        sample_specification,
-                    )
-                    assert result5["success"] is True
+            new=_async_return(workflow_mock_responses["spec"])
+        ))
+        stack.enter_context(patch.object(
+            guard.ai_proxy,
+            'call',
+            new=_async_sequence([
+                workflow_mock_responses[phase]
+                for phase in ("approach", "implementation", "tests", "review")
+            ])
+        ))
+        stack.enter_context(patch.object(guard, '_validate_checkpoint', return_value=True))
+        
+        for phase in _WORKFLOW_PHASES:
+            results[phase] = await phases[phase](results)
+            if not results[phase]["success"]:
+                break
+    
+    await guard.reset_state()
+    return results
+
+
+@pytest.mark.integration
+class TestEndToEndWorkflow:
+    """Test complete VIBEcoding workflow."""
+    
+    @pytest.mark.parametrize("phase", _WORKFLOW_PHASES)
+    async def test_workflow_phase_success(self, workflow_results, phase):
+        """Test that each phase of the workflow completes successfully."""
+        assert phase in workflow_results, f"{phase} did not run: an earlier phase failed"
+        assert workflow_results[phase]["success"] is True
     
     async def test_workflow_with_metrics_collection(
         self,
         vibezen_guard,
         sample_specification,
         metrics_collector,
+        monkeypatch,
     ):
         """Test that metrics are collected throughout workflow."""
-        # Replace guard's metrics collector
-        vibezen_guard.metrics_collector = metrics_collector
+        # Replace guard's metrics collector for this test only
+        monkeypatch.setattr(vibezen_guard, "metrics_collector", metrics_collector)
         
         with patch.object(vibezen_guard.ai_proxy, 'force_thinking') as mock_force:
             with patch.object(vibezen_guard.ai_proxy, 'call') as mock_call:
@@ -517,7 +565,7 @@ class TestEndToEndWorkflow:
                 )
                 
                 # Check metrics were collected
-                assert len(metrics_collector._buffer) > 0
+                assert metrics_collector.count() > 0
                 
                 # Flush and verify
                 await metrics_collector.flush()
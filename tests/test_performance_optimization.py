@@ -15,7 +15,7 @@ from vibezen.performance import (
     ResourceLimit,
     PerformanceProfiler,
 )
-from vibezen.performance.resource_manager import TokenBucket
+from vibezen.utils.rate_limiter import TokenBucket
 from vibezen.cache.semantic_cache_optimized import OptimizedSemanticCache
 
 
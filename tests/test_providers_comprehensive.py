@@ -281,6 +281,96 @@ class TestProviderCapabilities:
         assert "embedding" not in chat_providers
 
 
+@pytest.mark.unit
+class TestRecordedResponses:
+    """Test recording and replay of provider responses."""
+    
+    @pytest.fixture
+    def recorded_provider(self, tmp_path, monkeypatch):
+        """Create a provider whose call() is wrapped for recording."""
+        from vibezen.providers.recording import recorded_call
+        from vibezen.proxy.ai_proxy import AIResponse
+        from vibezen.core.models import ThinkingPhase, ThinkingStep, ThinkingTrace
+        
+        monkeypatch.setenv("VIBEZEN_LLM_MOCK_DIR", str(tmp_path))
+        for name in ("USE_MOCK_PROVIDER", "UPDATE_MOCK_CACHE", "OFFLINE_MODE"):
+            monkeypatch.delenv(name, raising=False)
+        
+        class EchoProvider:
+            config = ProviderConfig(name="echo")
+            
+            def __init__(self):
+                self.calls = 0
+            
+            @recorded_call
+            async def call(self, request):
+                self.calls += 1
+                return AIResponse(
+                    content=f"echo: {request.prompt}",
+                    provider="echo",
+                    model=request.model,
+                    thinking_trace=ThinkingTrace(
+                        id="trace",
+                        problem=request.prompt,
+                        phase=ThinkingPhase.SPEC_UNDERSTANDING,
+                        steps=[ThinkingStep(
+                            step_number=1,
+                            phase=ThinkingPhase.SPEC_UNDERSTANDING,
+                            thought="Echo the prompt",
+                            confidence=0.9,
+                        )],
+                    ),
+                )
+        
+        return EchoProvider()
+    
+    async def test_record_then_replay(self, recorded_provider, tmp_path, monkeypatch):
+        """Test that a recorded response is replayed without calling the provider."""
+        from vibezen.proxy.ai_proxy import AIRequest
+        from vibezen.core.models import ThinkingTrace
+        
+        request = AIRequest(provider="echo", model="m", prompt="hello")
+        
+        monkeypatch.setenv("UPDATE_MOCK_CACHE", "true")
+        recorded = await recorded_provider.call(request)
+        assert recorded_provider.calls == 1
+        assert len(list((tmp_path / "echo").glob("*.json"))) == 1
+        
+        monkeypatch.delenv("UPDATE_MOCK_CACHE")
+        monkeypatch.setenv("USE_MOCK_PROVIDER", "true")
+        replayed = await recorded_provider.call(request)
+        assert recorded_provider.calls == 1
+        assert replayed.content == recorded.content
+        assert replayed.metadata["recorded"] is True
+        assert isinstance(replayed.thinking_trace, ThinkingTrace)
+        assert replayed.thinking_trace == recorded.thinking_trace
+    
+    async def test_offline_mode_without_recording(self, recorded_provider, monkeypatch):
+        """Test that offline replay never falls back to the provider."""
+        from vibezen.proxy.ai_proxy import AIRequest
+        
+        monkeypatch.setenv("USE_MOCK_PROVIDER", "true")
+        monkeypatch.setenv("OFFLINE_MODE", "true")
+        response = await recorded_provider.call(
+            AIRequest(provider="echo", model="m", prompt="unrecorded")
+        )
+        
+        assert recorded_provider.calls == 0
+        assert response.metadata["error"] == "recording_not_found"
+    
+    async def test_replay_requires_mock_dir(self, recorded_provider, monkeypatch):
+        """Test that replay without a recording directory is refused."""
+        from vibezen.providers.recording import replay_available
+        from vibezen.proxy.ai_proxy import AIRequest
+        
+        monkeypatch.delenv("VIBEZEN_LLM_MOCK_DIR")
+        monkeypatch.setenv("USE_MOCK_PROVIDER", "true")
+        
+        assert not replay_available("echo")
+        with pytest.raises(RuntimeError, match="VIBEZEN_LLM_MOCK_DIR"):
+            await recorded_provider.call(AIRequest(provider="echo", model="m", prompt="hi"))
+
+
 @pytest.mark.integration
 class TestProviderIntegration:
     """Integration tests for providers."""
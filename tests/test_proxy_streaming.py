@@ -0,0 +1,150 @@
+"""
+Test streamed AI calls through the proxy.
+"""
+
+import pytest
+
+from vibezen.error_recovery import CircuitOpenError
+from vibezen.proxy.ai_proxy import AIProxy, ProxyConfig, AIProvider, AIRequest, AIResponse
+
+
+class ChunkedProvider(AIProvider):
+    """Provider that streams its response word by word."""
+    
+    def __init__(self):
+        self.streamed_chunks = 0
+    
+    async def call(self, request: AIRequest) -> AIResponse:
+        """Return the whole response at once."""
+        return AIResponse(
+            content="one two three four",
+            provider="chunked",
+            model=request.model
+        )
+    
+    async def stream(self, request: AIRequest):
+        """Yield the response one word at a time."""
+        for word in ("one ", "two ", "three ", "four"):
+            self.streamed_chunks += 1
+            yield word
+    
+    def is_available(self) -> bool:
+        return True
+
+
+class BrokenStreamProvider(ChunkedProvider):
+    """Provider whose stream fails after the first chunk."""
+    
+    def __init__(self):
+        super().__init__()
+        self.streams_opened = 0
+    
+    async def stream(self, request: AIRequest):
+        """Yield one word, then fail."""
+        self.streams_opened += 1
+        yield "one "
+        raise ConnectionError("Stream interrupted")
+
+
+def make_proxy() -> AIProxy:
+    """Create an exact-cache proxy with the chunked provider registered."""
+    proxy = AIProxy(ProxyConfig(cache_prompts=True, enable_semantic_cache=False))
+    proxy.register_provider("chunked", ChunkedProvider())
+    return proxy
+
+
+async def test_stream_collects_chunks():
+    """Test that streamed chunks reach on_chunk and the final response."""
+    proxy = make_proxy()
+    received = []
+    
+    response = await proxy.call(
+        prompt="Count to four",
+        provider="chunked",
+        model="test-model",
+        stream=True,
+        on_chunk=received.append
+    )
+    
+    assert received == ["one ", "two ", "three ", "four"]
+    assert response.content == "one two three four"
+    assert response.metadata["streamed"] is True
+    assert response.metadata["stream_stopped"] is False
+    assert response.metadata["from_cache"] is False
+
+
+async def test_stream_stops_early_and_is_not_cached():
+    """Test that on_chunk can stop a stream and partial content is not cached."""
+    proxy = make_proxy()
+    provider = proxy.providers["chunked"]
+    received = []
+    
+    def on_chunk(chunk):
+        received.append(chunk)
+        return len(received) < 2
+    
+    response = await proxy.call(
+        prompt="Count to four",
+        provider="chunked",
+        model="test-model",
+        stream=True,
+        on_chunk=on_chunk
+    )
+    
+    assert response.content == "one two "
+    assert response.metadata["stream_stopped"] is True
+    assert provider.streamed_chunks == 2
+    
+    # A regular call afterwards must not see the partial response
+    full = await proxy.call(
+        prompt="Count to four",
+        provider="chunked",
+        model="test-model"
+    )
+    assert full.metadata["from_cache"] is False
+    assert full.content == "one two three four"
+
+
+async def test_stream_falls_back_to_whole_response():
+    """Test that providers without streaming deliver one chunk."""
+    proxy = make_proxy()
+    received = []
+    
+    response = await proxy.call(
+        prompt="Test prompt",
+        provider="mock",
+        model="test-model",
+        stream=True,
+        on_chunk=received.append
+    )
+    
+    assert received == [response.content]
+
+
+async def test_stream_respects_open_circuit_breaker():
+    """Test that streamed calls count toward and are rejected by the circuit breaker."""
+    proxy = AIProxy(ProxyConfig(
+        enable_circuit_breaker=True,
+        circuit_breaker_failure_threshold=2,
+        enable_fallback=False
+    ))
+    provider = BrokenStreamProvider()
+    proxy.register_provider("broken", provider)
+    
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await proxy.call(
+                prompt="Count to four",
+                provider="broken",
+                model="test-model",
+                stream=True
+            )
+    
+    with pytest.raises(CircuitOpenError):
+        await proxy.call(
+            prompt="Count to four",
+            provider="broken",
+            model="test-model",
+            stream=True
+        )
+    assert provider.streams_opened == 2
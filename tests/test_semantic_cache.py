@@ -3,7 +3,7 @@ Test semantic caching functionality.
 """
 
 import numpy as np
-from datetime import datetime, timedelta, timezone
+import time
 
 from vibezen.cache.semantic_cache import (
     SemanticCache, SemanticCacheEntry, SimpleEmbeddingProvider,
@@ -136,8 +136,8 @@ class TestSemanticCache:
             prompt="test prompt",
             response="test response",
             embedding=np.zeros(128),
-            created_at=datetime.now(timezone.utc) - timedelta(seconds=2),
-            ttl_seconds=1
+            ttl_seconds=1,
+            created_ns=time.monotonic_ns() - 2_000_000_000
         )
         
         assert entry.is_expired()
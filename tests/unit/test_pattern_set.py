@@ -0,0 +1,36 @@
+"""
+Unit tests for regex pattern sets.
+"""
+
+import pytest
+
+from vibezen.utils.pattern_set import PatternSet, compile_patterns
+
+
+HARDCODE_PATTERNS = (
+    r'port\s*=\s*\d+',
+    r'password\s*=\s*["\']',
+    r'(localhost|127\.0\.0\.1)',
+)
+
+
+@pytest.mark.unit
+class TestPatternSet:
+    """Test cases for PatternSet."""
+    
+    def test_matching_patterns_in_order(self):
+        """Test that every matching pattern is reported in pattern order."""
+        pattern_set = PatternSet(HARDCODE_PATTERNS)
+        code = 'host = "localhost"\nport = 8080\n'
+        
+        assert pattern_set.matching(code) == [HARDCODE_PATTERNS[0], HARDCODE_PATTERNS[2]]
+    
+    def test_no_match(self):
+        """Test that clean code matches nothing."""
+        pattern_set = PatternSet(HARDCODE_PATTERNS)
+        
+        assert pattern_set.matching("def add(a, b):\n    return a + b\n") == []
+    
+    def test_compiled_sets_are_reused(self):
+        """Test that the same patterns compile only once."""
+        assert compile_patterns(HARDCODE_PATTERNS) is compile_patterns(HARDCODE_PATTERNS)